@@ -14,6 +14,10 @@ Usage:
 Optional flags:
     --technical  # Display results in technical format instead of user-friendly format
     --modules MODULE1 MODULE2 ...  # Specify multiple modules to audit/remediate
+    --concurrency N  # Number of submodule audits to run at the same time (default: 4, alias: --parallel)
+    --cache  # Reuse passing results of file-based audits from a root-only cache (requires root)
+    --output PATH  # Append each audit result to PATH as a JSON line
+    --fail-fast  # Stop auditing after the first section that fails
 
 Examples:
     # Run all audit checks with user-friendly output
@@ -32,156 +36,206 @@ Examples:
     python3 cis_audit.py remediate bootloader
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS/SECURE
-    'RED': '\033[91m',    # Red for FAIL/VULNERABLE
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
+import os
 import sys
+import stat
 import importlib
-import argparse
-import io
-
-# Import modules from the new structure
-from modules.kernel import fs_modules
-from modules.filesystem import partitions
-from modules.package_management import repositories, updates
-from modules.access_control import apparmor
-from modules.bootloader import configuration
-from modules.process_hardening import process_restrictions
-from modules.command_line_warning import warning_banners
-
-# Dictionary of user-friendly explanations for each benchmark
-USER_FRIENDLY_EXPLANATIONS = {
-    "1.1.1": {
-        "title": "Filesystem Kernel Modules",
-        "overview": "These checks ensure that unnecessary and potentially vulnerable filesystem modules are disabled.",
-        "importance": "Disabling unnecessary kernel modules reduces the attack surface of the system and minimizes potential security vulnerabilities.",
-        "pass_meaning": "The module is either not available or properly disabled, which is good for security.",
-        "fail_meaning": "The module can be loaded, which poses a potential security risk.",
-        "remediation_explanation": "The system will create configuration files that prevent these modules from being loaded.",
-        "modules": {
-            "cramfs": "An old, compressed read-only filesystem that is rarely needed in modern systems.",
-            "freevxfs": "The Veritas filesystem driver, which is not commonly used and may contain vulnerabilities.",
-            "jffs2": "A filesystem designed for flash devices, not typically needed on server systems.",
-            "hfs": "Apple's legacy Hierarchical File System, rarely needed on Linux servers.",
-            "hfsplus": "Apple's HFS+ filesystem, rarely needed on Linux servers.",
-            "squashfs": "A compressed read-only filesystem, often used in live CDs but not typically needed on servers.",
-            "udf": "Universal Disk Format, used for DVDs and optical media, rarely needed on servers.",
-            "fat": "The FAT filesystem (including VFAT), primarily used for compatibility with Windows."
-        }
-    },
-    "1.1.2": {
-        "title": "Filesystem Partition Configuration",
-        "overview": "These checks ensure that critical filesystem partitions are properly configured with appropriate mount options.",
-        "importance": "Properly configured partitions with appropriate mount options help prevent privilege escalation and protect against various security threats.",
-        "pass_meaning": "The partition is properly configured with the required mount options.",
-        "fail_meaning": "The partition is either not properly configured or missing required security options.",
-        "remediation_explanation": "Filesystem partition remediations require manual intervention. The system will provide instructions for manually configuring the partitions with appropriate mount options in /etc/fstab.",
-        "modules": {
-            "/tmp partition": "A separate partition for temporary files that prevents filling up the root filesystem and provides security controls.",
-            "/tmp nodev": "Prevents device files from being created in /tmp, which could be used for privilege escalation.",
-            "/tmp nosuid": "Prevents setuid programs in /tmp from changing the effective user ID, reducing privilege escalation risks.",
-            "/tmp noexec": "Prevents execution of binaries in /tmp, which is a common location for malware to store executable files.",
-            "/dev/shm partition": "A temporary filesystem in memory that needs proper security controls.",
-            "/dev/shm nodev": "Prevents device files from being created in shared memory, which could be used for privilege escalation.",
-            "/dev/shm nosuid": "Prevents setuid programs in shared memory from changing the effective user ID.",
-            "/dev/shm noexec": "Prevents execution of binaries in shared memory, reducing the risk of memory-based attacks."
-        }
-    },
-    "1.2.1": {
-        "title": "Package Repositories",
-        "overview": "These checks ensure that package repositories are properly configured and secured.",
-        "importance": "Properly configured package repositories ensure that software is obtained from trusted sources and that package integrity is verified.",
-        "pass_meaning": "The package repositories are properly configured and secured.",
-        "fail_meaning": "The package repositories are not properly configured or secured, which could lead to compromised software.",
-        "remediation_explanation": "The system will provide instructions for properly configuring package repositories and GPG keys.",
-        "modules": {
-            "GPG keys": "Cryptographic keys used to verify the authenticity of packages.",
-            "package repositories": "Sources from which software packages are downloaded and installed."
-        }
-    },
-    "1.2.2": {
-        "title": "Package Updates",
-        "overview": "These checks ensure that the system is configured to receive security updates.",
-        "importance": "Regular security updates are critical for maintaining system security and addressing known vulnerabilities.",
-        "pass_meaning": "The system is properly configured to receive security updates.",
-        "fail_meaning": "The system is not properly configured to receive security updates, which could leave it vulnerable.",
-        "remediation_explanation": "The system will provide instructions for configuring automatic security updates.",
-        "modules": {
-            "updates": "Configuration for receiving and applying security updates."
-        }
-    },
-    "1.3.1": {
-        "title": "AppArmor Configuration",
-        "overview": "These checks ensure that AppArmor is properly installed, enabled, and configured.",
-        "importance": "AppArmor provides Mandatory Access Control (MAC) which restricts programs to a limited set of resources, reducing the potential damage from compromised software.",
-        "pass_meaning": "AppArmor is properly installed, enabled, and configured.",
-        "fail_meaning": "AppArmor is not properly installed, enabled, or configured, which could leave the system vulnerable.",
-        "remediation_explanation": "The system will provide instructions for installing, enabling, and configuring AppArmor.",
-        "modules": {
-            "AppArmor": "A Linux Security Module that provides Mandatory Access Control.",
-            "AppArmor profiles": "Configuration files that define the resources a program can access."
-        }
-    },
-    "1.4": {
-        "title": "Bootloader Configuration",
-        "overview": "These checks ensure that the bootloader is properly secured.",
-        "importance": "A properly secured bootloader prevents unauthorized users from modifying boot parameters or booting into single user mode.",
-        "pass_meaning": "The bootloader is properly secured.",
-        "fail_meaning": "The bootloader is not properly secured, which could allow unauthorized access.",
-        "remediation_explanation": "The system will provide instructions for securing the bootloader.",
-        "modules": {
-            "bootloader password": "A password that restricts access to the bootloader.",
-            "bootloader permissions": "File permissions that prevent unauthorized modification of bootloader configuration."
-        }
-    },
-    "1.5": {
-        "title": "Process Hardening",
-        "overview": "These checks ensure that additional process hardening measures are in place.",
-        "importance": "Process hardening measures help prevent exploitation of vulnerabilities in running processes.",
-        "pass_meaning": "The process hardening measure is properly configured.",
-        "fail_meaning": "The process hardening measure is not properly configured, which could leave processes vulnerable.",
-        "remediation_explanation": "The system will provide instructions for configuring process hardening measures.",
-        "modules": {
-            "address space layout randomization": "A security technique that randomizes memory addresses to make exploitation more difficult.",
-            "ptrace scope": "Controls which processes can use ptrace to examine the memory and registers of other processes.",
-            "core dumps": "Memory snapshots created when a program crashes, which could contain sensitive information.",
-            "prelink": "A program that modifies ELF binaries to speed up loading, but can interfere with security measures.",
-            "automatic error reporting": "A feature that sends crash reports, which could contain sensitive information."
-        }
-    },
-    "1.6": {
-        "title": "Command Line Warning Banners",
-        "overview": "These checks ensure that appropriate warning banners are displayed to users.",
-        "importance": "Warning banners inform users about authorized use of the system and may have legal implications.",
-        "pass_meaning": "The warning banner is properly configured.",
-        "fail_meaning": "The warning banner is not properly configured, which could have legal implications.",
-        "remediation_explanation": "The system will provide instructions for configuring warning banners.",
-        "modules": {
-            "message of the day": "A message displayed to users when they log in.",
-            "local login warning": "A warning displayed to users logging in locally.",
-            "remote login warning": "A warning displayed to users logging in remotely.",
-            "su command access": "Controls which users can use the su command to become root."
-        }
+import functools
+import contextlib
+from dataclasses import dataclass
+
+from modules._common import COLORS, thread_local_stdout
+
+GREEN, RED, YELLOW, BLUE, RESET = (COLORS[key] for key in ("GREEN", "RED", "YELLOW", "BLUE", "RESET"))
+
+# Banner rules and the section header prefix, built once
+_BAR_EQ = "=" * 80
+_BAR_DASH = "-" * 80
+_HDR_PREFIX = f"\n{_BAR_EQ}\n{BLUE}CIS Benchmark Section: "
+
+# Colored status tags and lines for the user-friendly output, built once
+_PASS_TAG = f"{GREEN}✅ PASS:{RESET}"
+_FAIL_TAG = f"{RED}❌ FAIL:{RESET}"
+_SECURE_TAG = f"{GREEN}✅ SECURE{RESET}"
+_VULNERABLE_TAG = f"{RED}❌ VULNERABLE{RESET}"
+_SECURE_STATUS = f"{GREEN}Status: This module is properly secured on your system.{RESET}"
+_VULNERABLE_STATUS = f"{RED}Status: This module is not properly secured and poses a potential risk.{RESET}"
+_OVERALL_SECURE = (
+    f"\n{GREEN}✅ Overall Result: SECURE{RESET}",
+    f"{GREEN}All checks passed. Your system is properly configured.{RESET}",
+)
+_OVERALL_VULNERABLE = (
+    f"\n{YELLOW}⚠️ Overall Result: VULNERABLE{RESET}",
+    f"{RED}Some checks failed. Your system may be at risk.{RESET}",
+    "Recommendation: Run the remediation to address these issues.",
+)
+
+@dataclass(frozen=True, slots=True)
+class SectionInfo:
+    """
+    User-friendly explanation of a benchmark section and its checks
+    """
+    title: str
+    overview: str
+    importance: str
+    pass_meaning: str
+    fail_meaning: str
+    remediation_explanation: str
+    modules: dict
+
+
+@functools.lru_cache(maxsize=1)
+def _get_explanations():
+    """
+    Return the user-friendly explanations for each benchmark section, keyed by section_id
+
+    Built on first use so runs that never print a friendly section skip it.
+    """
+    return {
+        "1.1.1": SectionInfo(
+            title="Filesystem Kernel Modules",
+            overview="These checks ensure that unnecessary and potentially vulnerable filesystem modules are disabled.",
+            importance="Disabling unnecessary kernel modules reduces the attack surface of the system and minimizes potential security vulnerabilities.",
+            pass_meaning="The module is either not available or properly disabled, which is good for security.",
+            fail_meaning="The module can be loaded, which poses a potential security risk.",
+            remediation_explanation="The system will create configuration files that prevent these modules from being loaded.",
+            modules={
+                "cramfs": "An old, compressed read-only filesystem that is rarely needed in modern systems.",
+                "freevxfs": "The Veritas filesystem driver, which is not commonly used and may contain vulnerabilities.",
+                "jffs2": "A filesystem designed for flash devices, not typically needed on server systems.",
+                "hfs": "Apple's legacy Hierarchical File System, rarely needed on Linux servers.",
+                "hfsplus": "Apple's HFS+ filesystem, rarely needed on Linux servers.",
+                "squashfs": "A compressed read-only filesystem, often used in live CDs but not typically needed on servers.",
+                "udf": "Universal Disk Format, used for DVDs and optical media, rarely needed on servers.",
+                "fat": "The FAT filesystem (including VFAT), primarily used for compatibility with Windows."
+            }
+        ),
+        "1.1.2": SectionInfo(
+            title="Filesystem Partition Configuration",
+            overview="These checks ensure that critical filesystem partitions are properly configured with appropriate mount options.",
+            importance="Properly configured partitions with appropriate mount options help prevent privilege escalation and protect against various security threats.",
+            pass_meaning="The partition is properly configured with the required mount options.",
+            fail_meaning="The partition is either not properly configured or missing required security options.",
+            remediation_explanation="Filesystem partition remediations require manual intervention. The system will provide instructions for manually configuring the partitions with appropriate mount options in /etc/fstab.",
+            modules={
+                "/tmp partition": "A separate partition for temporary files that prevents filling up the root filesystem and provides security controls.",
+                "/tmp nodev": "Prevents device files from being created in /tmp, which could be used for privilege escalation.",
+                "/tmp nosuid": "Prevents setuid programs in /tmp from changing the effective user ID, reducing privilege escalation risks.",
+                "/tmp noexec": "Prevents execution of binaries in /tmp, which is a common location for malware to store executable files.",
+                "/dev/shm partition": "A temporary filesystem in memory that needs proper security controls.",
+                "/dev/shm nodev": "Prevents device files from being created in shared memory, which could be used for privilege escalation.",
+                "/dev/shm nosuid": "Prevents setuid programs in shared memory from changing the effective user ID.",
+                "/dev/shm noexec": "Prevents execution of binaries in shared memory, reducing the risk of memory-based attacks."
+            }
+        ),
+        "1.2.1": SectionInfo(
+            title="Package Repositories",
+            overview="These checks ensure that package repositories are properly configured and secured.",
+            importance="Properly configured package repositories ensure that software is obtained from trusted sources and that package integrity is verified.",
+            pass_meaning="The package repositories are properly configured and secured.",
+            fail_meaning="The package repositories are not properly configured or secured, which could lead to compromised software.",
+            remediation_explanation="The system will provide instructions for properly configuring package repositories and GPG keys.",
+            modules={
+                "GPG keys": "Cryptographic keys used to verify the authenticity of packages.",
+                "package repositories": "Sources from which software packages are downloaded and installed."
+            }
+        ),
+        "1.2.2": SectionInfo(
+            title="Package Updates",
+            overview="These checks ensure that the system is configured to receive security updates.",
+            importance="Regular security updates are critical for maintaining system security and addressing known vulnerabilities.",
+            pass_meaning="The system is properly configured to receive security updates.",
+            fail_meaning="The system is not properly configured to receive security updates, which could leave it vulnerable.",
+            remediation_explanation="The system will provide instructions for configuring automatic security updates.",
+            modules={
+                "updates": "Configuration for receiving and applying security updates."
+            }
+        ),
+        "1.3.1": SectionInfo(
+            title="AppArmor Configuration",
+            overview="These checks ensure that AppArmor is properly installed, enabled, and configured.",
+            importance="AppArmor provides Mandatory Access Control (MAC) which restricts programs to a limited set of resources, reducing the potential damage from compromised software.",
+            pass_meaning="AppArmor is properly installed, enabled, and configured.",
+            fail_meaning="AppArmor is not properly installed, enabled, or configured, which could leave the system vulnerable.",
+            remediation_explanation="The system will provide instructions for installing, enabling, and configuring AppArmor.",
+            modules={
+                "AppArmor": "A Linux Security Module that provides Mandatory Access Control.",
+                "AppArmor bootloader parameters": "Kernel boot options that turn AppArmor on when the system starts.",
+                "AppArmor profiles": "Configuration files that define the resources a program can access."
+            }
+        ),
+        "1.4": SectionInfo(
+            title="Bootloader Configuration",
+            overview="These checks ensure that the bootloader is properly secured.",
+            importance="A properly secured bootloader prevents unauthorized users from modifying boot parameters or booting into single user mode.",
+            pass_meaning="The bootloader is properly secured.",
+            fail_meaning="The bootloader is not properly secured, which could allow unauthorized access.",
+            remediation_explanation="The system will provide instructions for securing the bootloader.",
+            modules={
+                "bootloader password": "A password that restricts access to the bootloader.",
+                "bootloader permissions": "File permissions that prevent unauthorized modification of bootloader configuration."
+            }
+        ),
+        "1.5": SectionInfo(
+            title="Process Hardening",
+            overview="These checks ensure that additional process hardening measures are in place.",
+            importance="Process hardening measures help prevent exploitation of vulnerabilities in running processes.",
+            pass_meaning="The process hardening measure is properly configured.",
+            fail_meaning="The process hardening measure is not properly configured, which could leave processes vulnerable.",
+            remediation_explanation="The system will provide instructions for configuring process hardening measures.",
+            modules={
+                "address space layout randomization": "A security technique that randomizes memory addresses to make exploitation more difficult.",
+                "ptrace scope": "Controls which processes can use ptrace to examine the memory and registers of other processes.",
+                "core dumps": "Memory snapshots created when a program crashes, which could contain sensitive information.",
+                "prelink": "A program that modifies ELF binaries to speed up loading, but can interfere with security measures.",
+                "automatic error reporting": "A feature that sends crash reports, which could contain sensitive information."
+            }
+        ),
+        "1.6": SectionInfo(
+            title="Command Line Warning Banners",
+            overview="These checks ensure that appropriate warning banners are displayed to users.",
+            importance="Warning banners inform users about authorized use of the system and may have legal implications.",
+            pass_meaning="The warning banner is properly configured.",
+            fail_meaning="The warning banner is not properly configured, which could have legal implications.",
+            remediation_explanation="The system will provide instructions for configuring warning banners.",
+            modules={
+                "message of the day": "A message displayed to users when they log in.",
+                "local login warning": "A warning displayed to users logging in locally.",
+                "remote login warning": "A warning displayed to users logging in remotely.",
+                "su command access": "Controls which users can use the su command to become root."
+            }
+        ),
+        # Add more sections as they are implemented
     }
-    # Add more sections as they are implemented
-}
 
-# List of all modules to run (will be expanded as more modules are added)
+
+# List of all modules to run (will be expanded as more modules are added).
+# Submodules are referenced by dotted path and only imported when selected.
+# Submodules whose checks only read files list them under "inputs" so that,
+# with --cache, passing results can be reused until one of those files changes.
+# The package updates check is not cached: its verdict depends on the APT
+# lists, preferences and sources as well as dpkg, and fingerprinting all of
+# them costs about as much as running it.
 MODULES = [
     {
         "name": "kernel",
         "submodules": [
             {
                 "name": "fs_modules",
-                "module": fs_modules,
-                "title": "1.1.1 Filesystem Kernel Modules",
-                "description": "Ensure unnecessary filesystem modules are disabled"
+                "module_path": "modules.kernel.fs_modules",
+                "section_id": "1.1.1",
+                "display_title": "Filesystem Kernel Modules",
+                "description": "Ensure unnecessary filesystem modules are disabled",
+                "checks": (
+                    ("1.1.1.1", "cramfs"),
+                    ("1.1.1.2", "freevxfs"),
+                    ("1.1.1.3", "jffs2"),
+                    ("1.1.1.4", "hfs"),
+                    ("1.1.1.5", "hfsplus"),
+                    ("1.1.1.6", "squashfs"),
+                    ("1.1.1.7", "udf"),
+                    ("1.1.1.8", "fat")
+                )
             }
         ]
     },
@@ -190,9 +244,20 @@ MODULES = [
         "submodules": [
             {
                 "name": "partitions",
-                "module": partitions,
-                "title": "1.1.2 Filesystem Partition Configuration",
-                "description": "Ensure proper filesystem partitioning and mounting"
+                "module_path": "modules.filesystem.partitions",
+                "section_id": "1.1.2",
+                "display_title": "Filesystem Partition Configuration",
+                "description": "Ensure proper filesystem partitioning and mounting",
+                "checks": (
+                    ("1.1.2.1", "/tmp partition"),
+                    ("1.1.2.2", "/tmp nodev"),
+                    ("1.1.2.3", "/tmp nosuid"),
+                    ("1.1.2.4", "/tmp noexec"),
+                    ("1.1.2.5", "/dev/shm partition"),
+                    ("1.1.2.6", "/dev/shm nodev"),
+                    ("1.1.2.7", "/dev/shm nosuid"),
+                    ("1.1.2.8", "/dev/shm noexec")
+                )
             }
         ]
     },
@@ -201,15 +266,30 @@ MODULES = [
         "submodules": [
             {
                 "name": "repositories",
-                "module": repositories,
-                "title": "1.2.1 Configure Package Repositories",
-                "description": "Ensure package repositories are properly configured"
+                "module_path": "modules.package_management.repositories",
+                "section_id": "1.2.1",
+                "display_title": "Configure Package Repositories",
+                "description": "Ensure package repositories are properly configured",
+                "inputs": [
+                    "/etc/apt/trusted.gpg",
+                    "/etc/apt/trusted.gpg.d",
+                    "/etc/apt/sources.list",
+                    "/etc/apt/sources.list.d"
+                ],
+                "checks": (
+                    ("1.2.1.1", "GPG keys"),
+                    ("1.2.1.2", "package repositories")
+                )
             },
             {
                 "name": "updates",
-                "module": updates,
-                "title": "1.2.2 Configure Package Updates",
-                "description": "Ensure package updates are properly configured"
+                "module_path": "modules.package_management.updates",
+                "section_id": "1.2.2",
+                "display_title": "Configure Package Updates",
+                "description": "Ensure package updates are properly configured",
+                "checks": (
+                    ("1.2.2.1", "updates"),
+                )
             }
         ]
     },
@@ -218,9 +298,15 @@ MODULES = [
         "submodules": [
             {
                 "name": "apparmor",
-                "module": apparmor,
-                "title": "1.3.1 Configure AppArmor",
-                "description": "Ensure AppArmor is properly configured"
+                "module_path": "modules.access_control.apparmor",
+                "section_id": "1.3.1",
+                "display_title": "Configure AppArmor",
+                "description": "Ensure AppArmor is properly configured",
+                "checks": (
+                    ("1.3.1.1", "AppArmor"),
+                    ("1.3.1.2", "AppArmor bootloader parameters"),
+                    ("1.3.1.3", "AppArmor profiles")
+                )
             }
         ]
     },
@@ -229,9 +315,15 @@ MODULES = [
         "submodules": [
             {
                 "name": "configuration",
-                "module": configuration,
-                "title": "1.4 Configure Bootloader",
-                "description": "Ensure bootloader is properly configured"
+                "module_path": "modules.bootloader.configuration",
+                "section_id": "1.4",
+                "display_title": "Configure Bootloader",
+                "description": "Ensure bootloader is properly configured",
+                "inputs": ["/boot/grub/grub.cfg"],
+                "checks": (
+                    ("1.4.1", "bootloader password"),
+                    ("1.4.2", "bootloader permissions")
+                )
             }
         ]
     },
@@ -240,9 +332,17 @@ MODULES = [
         "submodules": [
             {
                 "name": "process_restrictions",
-                "module": process_restrictions,
-                "title": "1.5 Configure Additional Process Hardening",
-                "description": "Ensure additional process hardening measures are in place"
+                "module_path": "modules.process_hardening.process_restrictions",
+                "section_id": "1.5",
+                "display_title": "Configure Additional Process Hardening",
+                "description": "Ensure additional process hardening measures are in place",
+                "checks": (
+                    ("1.5.1", "address space layout randomization"),
+                    ("1.5.2", "ptrace scope"),
+                    ("1.5.3", "core dumps"),
+                    ("1.5.4", "prelink"),
+                    ("1.5.5", "automatic error reporting")
+                )
             }
         ]
     },
@@ -251,9 +351,23 @@ MODULES = [
         "submodules": [
             {
                 "name": "warning_banners",
-                "module": warning_banners,
-                "title": "1.6 Configure Command Line Warning Banners",
-                "description": "Ensure command line warning banners are properly configured"
+                "module_path": "modules.command_line_warning.warning_banners",
+                "section_id": "1.6",
+                "display_title": "Configure Command Line Warning Banners",
+                "description": "Ensure command line warning banners are properly configured",
+                "inputs": [
+                    "/etc/motd",
+                    "/etc/update-motd.d",
+                    "/etc/issue",
+                    "/etc/issue.net",
+                    "/etc/pam.d/su"
+                ],
+                "checks": (
+                    ("1.6.1", "message of the day"),
+                    ("1.6.2", "local login warning"),
+                    ("1.6.3", "remote login warning"),
+                    ("1.6.4", "su command access")
+                )
             }
         ]
     },
@@ -262,315 +376,504 @@ MODULES = [
     #     "submodules": [
     #         {
     #             "name": "service_clients",
-    #             "module": None,  # Will be imported when implemented
-    #             "title": "2.1-2.4 Services",
+    #             "module_path": None,  # Will be set when implemented
+    #             "section_id": "2.1",
+    #             "display_title": "Services",
     #             "description": "Ensure unnecessary services are disabled"
     #         }
     #     ]
     # },
 ]
 
+# Flat lookups over MODULES, built once since the registry is static
+_ALL_SUBS = tuple(submodule for module_group in MODULES for submodule in module_group["submodules"])
+_GROUPS_BY_NAME = {module_group["name"]: tuple(module_group["submodules"]) for module_group in MODULES}
+_SUBMODULES_BY_NAME = {submodule["name"]: submodule for submodule in _ALL_SUBS}
+
 
 def print_section_header(title, description):
     """
     Print a formatted section header
     """
-    print("\n" + "=" * 80)
-    print(f"{COLORS['BLUE']}CIS Benchmark Section: {title}{COLORS['RESET']}")
-    print(f"{COLORS['BLUE']}Description: {description}{COLORS['RESET']}")
-    print("=" * 80)
+    sys.stdout.write(f"{_HDR_PREFIX}{title}{RESET}\n{BLUE}Description: {description}{RESET}\n{_BAR_EQ}\n")
 
 
-def print_user_friendly_header(section_id, title):
+def print_user_friendly_header(section_info, title):
     """
-    Print a user-friendly section header with explanation
+    Print a user-friendly section header with the section's SectionInfo explanation
     """
-    section_info = USER_FRIENDLY_EXPLANATIONS.get(section_id, {})
-    
-    print("\n" + "=" * 80)
-    print(f"Security Check: {title}")
-    print("=" * 80)
+    lines = ["\n" + _BAR_EQ, f"Security Check: {title}", _BAR_EQ]
     
     if section_info:
-        print(f"\nWhat this means: {section_info.get('overview', '')}")
-        print(f"\nWhy it's important: {section_info.get('importance', '')}")
-        print("\nWhat the results mean:")
-        print(f"  {COLORS['GREEN']}✅ PASS:{COLORS['RESET']} {section_info.get('pass_meaning', '')}")
-        print(f"  {COLORS['RED']}❌ FAIL:{COLORS['RESET']} {section_info.get('fail_meaning', '')}")
-        print("\n" + "-" * 80)
+        lines += [
+            f"\nWhat this means: {section_info.overview}",
+            f"\nWhy it's important: {section_info.importance}",
+            "\nWhat the results mean:",
+            f"  {_PASS_TAG} {section_info.pass_meaning}",
+            f"  {_FAIL_TAG} {section_info.fail_meaning}",
+            "\n" + _BAR_DASH,
+        ]
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def explain_module_result(module_name, result, section_id):
+def format_module_result(module_name, result, section_info):
     """
-    Provide a user-friendly explanation of a module check result
+    Return the user-friendly explanation of a module check result
     """
-    section_info = USER_FRIENDLY_EXPLANATIONS.get(section_id, {})
-    module_info = section_info.get('modules', {}).get(module_name, "")
+    module_info = section_info.modules.get(module_name, "") if section_info else ""
     
-    if result:
-        status = f"{COLORS['GREEN']}✅ SECURE{COLORS['RESET']}"
-    else:
-        status = f"{COLORS['RED']}❌ VULNERABLE{COLORS['RESET']}"
+    status = _SECURE_TAG if result else _VULNERABLE_TAG
     
-    print(f"\n{status}: {module_name} module")
+    lines = [f"\n{status}: {module_name} module"]
     if module_info:
-        print(f"What is it: {module_info}")
+        lines.append(f"What is it: {module_info}")
     
     if result:
-        print(f"{COLORS['GREEN']}Status: This module is properly secured on your system.{COLORS['RESET']}")
+        lines.append(_SECURE_STATUS)
     else:
-        print(f"{COLORS['RED']}Status: This module is not properly secured and poses a potential risk.{COLORS['RESET']}")
-        print(f"Recommendation: Run the remediation to secure this module.")
+        lines.append(_VULNERABLE_STATUS)
+        lines.append("Recommendation: Run the remediation to secure this module.")
+    
+    return "\n".join(lines) + "\n"
+
+
+def submodule_title(submodule):
+    """
+    Return a submodule's numbered title, e.g. "1.4 Configure Bootloader"
+    """
+    return f"{submodule['section_id']} {submodule['display_title']}"
+
+
+@functools.lru_cache(maxsize=None)
+def _import_module(module_path):
+    """
+    Import an audit module by dotted path, once per process
+    """
+    return importlib.import_module(module_path)
+
+
+def load_module(submodule):
+    """
+    Import a submodule's audit module on first use and return it
+    """
+    return _import_module(submodule["module_path"])
 
 
 def filter_modules(target_module):
     """
     Filter modules based on the target module name
+
+    Returns a flat tuple of submodules: every submodule for "all", the group's
+    submodules for a group name, or the single matching submodule. A list of
+    names selects the union of their submodules, in MODULES order.
     """
+    if not isinstance(target_module, str):
+        selected = {id(submodule) for name in target_module for submodule in filter_modules(name)}
+        return tuple(submodule for submodule in _ALL_SUBS if id(submodule) in selected)
     if target_module == "all":
-        return MODULES
+        return _ALL_SUBS
+    if target_module in _GROUPS_BY_NAME:
+        return _GROUPS_BY_NAME[target_module]
+    if target_module in _SUBMODULES_BY_NAME:
+        return (_SUBMODULES_BY_NAME[target_module],)
+    return ()
+
+
+RESULT_CACHE_PATH = "/var/cache/cis_audit/results.json"
+
+
+class ResultCache:
+    """
+    On-disk store of passing audit results, used only with --cache
+
+    Entries are keyed by submodule and output mode and record the modification
+    and status-change times of the submodule's input files. An entry is only
+    reused while those times are unchanged, so editing, chmod-ing or chown-ing
+    an input invalidates it. Delete the cache file to clear it.
+
+    A replayed PASS is only as trustworthy as the file it comes from, so the
+    cache lives in a root-only directory, is written with mode 0600, and is
+    ignored unless it is a regular file owned by root that no one else can
+    read or write.
+    """
+
+    def __init__(self, path=RESULT_CACHE_PATH):
+        self.path = path
+        self._changed = False
+        self._entries = {}
+        import json
+        
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            return
+        with os.fdopen(fd) as cache_file:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode) or st.st_uid != 0 or st.st_mode & 0o077:
+                return
+            try:
+                self._entries = json.load(cache_file)
+            except ValueError:
+                pass
+
+    @staticmethod
+    def _stamp(path):
+        """
+        Return [path, mtime, ctime] for a file, or [path, None] if it cannot be
+        read. The ctime changes on chmod and chown as well as on writes.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return [path, None]
+        return [path, st.st_mtime_ns, st.st_ctime_ns]
+
+    @staticmethod
+    def fingerprint(inputs):
+        """
+        Return the stamps of the input files, walking directories recursively
+        so changes to any file inside them are seen too
+        """
+        stamps = []
+        for path in inputs:
+            stamps.append(ResultCache._stamp(path))
+            if os.path.isdir(path):
+                for root, dirs, files in os.walk(path):
+                    dirs.sort()
+                    for name in dirs + sorted(files):
+                        stamps.append(ResultCache._stamp(os.path.join(root, name)))
+        return stamps
+
+    def get(self, key, fingerprint):
+        """
+        Return the cached (result, output) pair for key, or None if the inputs changed
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry["inputs"] != fingerprint:
+            return None
+        return entry["result"], entry["output"]
+
+    def put(self, key, fingerprint, result, output):
+        """
+        Record a passing result for key
+        """
+        self._entries[key] = {"inputs": fingerprint, "result": result, "output": output}
+        self._changed = True
+
+    def save(self):
+        """
+        Write the cache back to disk if anything was added
+        """
+        if not self._changed:
+            return
+        
+        import json
+        
+        try:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+            with os.fdopen(fd, "w") as cache_file:
+                os.fchmod(fd, 0o600)
+                json.dump(self._entries, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+
+def _audit_submodule(proxy, module, user_friendly):
+    """
+    Run a submodule's audits on a worker thread
+
+    Returns the module's (benchmark_id_description, result) pairs and the
+    technical output it printed. In user-friendly mode the output is rebuilt
+    from the results, so the module's prints go straight to /dev/null instead
+    of being buffered.
+    """
+    if user_friendly:
+        with open(os.devnull, "w") as devnull, proxy.redirect(devnull):
+            return module.run_all_audits(return_results=True), ""
     
-    filtered_modules = []
+    import io
     
-    for module_group in MODULES:
-        if module_group["name"] == target_module:
-            filtered_modules.append(module_group)
-            continue
-            
-        filtered_submodules = []
-        for submodule in module_group["submodules"]:
-            if submodule["name"] == target_module:
-                filtered_submodules.append(submodule)
-                
-        if filtered_submodules:
-            filtered_module_group = module_group.copy()
-            filtered_module_group["submodules"] = filtered_submodules
-            filtered_modules.append(filtered_module_group)
+    with proxy.redirect(io.StringIO()) as buffer:
+        results = module.run_all_audits(return_results=True)
+    return results, buffer.getvalue()
+
+
+def _cache_key(submodule, section_id):
+    """
+    Return the ResultCache key for a submodule audit in the given output mode
+    """
+    return f"{submodule['name']}:{'technical' if section_id is None else 'friendly'}"
+
+
+def _audit_passed(results):
+    """
+    Return whether every (benchmark_id_description, result) pair passed
+    """
+    return all(status for _, status in results)
+
+
+def _write_results(output_file, submodule, results):
+    """
+    Append one JSON line per check result to output_file
+    """
+    import json
+    from datetime import datetime, timezone
     
-    return filtered_modules
+    timestamp = datetime.now(timezone.utc).isoformat()
+    # One compact encoder for the whole batch, written in a single call
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    lines = []
+    for description, status in results:
+        check_id, _, check_description = description.partition(" ")
+        lines.append(encode({
+            "section_id": submodule.get("section_id"),
+            "module": submodule["name"],
+            "check_id": check_id,
+            "description": check_description,
+            "pass": status,
+            "timestamp": timestamp,
+        }) + "\n")
+    output_file.write("".join(lines))
+
+
+_ACTIONS = {
+    "audit": ("🔍", "Audit"),
+    "remediate": ("🔧", "Remediation"),
+}
 
 
-def run_audits(target_module="all", user_friendly=True):
+def _run(target_module, user_friendly, action, concurrency=4, use_cache=False, output_path=None,
+         fail_fast=False):
     """
-    Run audit functions from selected modules with user-friendly output by default
+    Run the audit or remediation action over the selected submodules
+
+    target_module is a module or group name, "all", or a list of names.
+    Audits run concurrently and report their results; remediations change
+    system files, so they always run one at a time in MODULES order. Audits of
+    submodules with declared inputs reuse passing results from the ResultCache
+    when use_cache is True. When output_path is given, every audit result is
+    also appended to it as a JSON line. With fail_fast, audits stop after the
+    first section that fails.
     """
-    print(f"\n🔍 Starting CIS Ubuntu 22.04 LTS Benchmark Audit for {target_module}...\n")
+    icon, label = _ACTIONS[action]
+    target_names = [target_module] if isinstance(target_module, str) else list(target_module)
+    print(f"\n{icon} Starting CIS Ubuntu 22.04 LTS Benchmark {label} for {' '.join(target_names)}...\n")
+    
+    filtered_modules = filter_modules(target_names)
+    missing = [name for name in target_names if not filter_modules(name)]
     
-    filtered_modules = filter_modules(target_module)
+    for name in missing:
+        print(f"Error: Module '{name}' not found.")
+    
+    # Arguments that select the same modules again in the follow-up commands
+    if isinstance(target_module, str):
+        target_args = target_module
+    else:
+        target_args = "--modules " + " ".join(name for name in target_names if name not in missing)
     
     if not filtered_modules:
-        print(f"Error: Module '{target_module}' not found.")
-        print("Available modules:")
+        lines = ["Available modules:"]
         for module_group in MODULES:
-            print(f"  - {module_group['name']} (group)")
-            for submodule in module_group["submodules"]:
-                print(f"    - {submodule['name']}")
+            lines.append(f"  - {module_group['name']} (group)")
+            lines += [f"    - {submodule['name']}" for submodule in module_group["submodules"]]
+        sys.stdout.write("\n".join(lines) + "\n")
         return False
     
-    all_passed = True
+    # Build a flat list of (submodule, section_id) jobs in MODULES order
+    jobs = []
+    for submodule in filtered_modules:
+        if submodule["module_path"] is None:
+            continue
+        # Fall back to technical output when no user-friendly explanation exists
+        section_id = submodule.get("section_id") if user_friendly else None
+        if section_id not in _get_explanations():
+            section_id = None
+        jobs.append((submodule, section_id))
     
-    for module_group in filtered_modules:
-        for submodule in module_group["submodules"]:
-            if submodule["module"] is not None:
-                if user_friendly:
-                    # Handle user-friendly output based on module title
-                    if submodule["title"].startswith("1.1.1"):
-                        section_id = "1.1.1"
-                    elif submodule["title"].startswith("1.1.2"):
-                        section_id = "1.1.2"
-                    elif submodule["title"].startswith("1.2.1"):
-                        section_id = "1.2.1"
-                    elif submodule["title"].startswith("1.2.2"):
-                        section_id = "1.2.2"
-                    elif submodule["title"].startswith("1.3.1"):
-                        section_id = "1.3.1"
-                    elif submodule["title"].startswith("1.4"):
-                        section_id = "1.4"
-                    elif submodule["title"].startswith("1.5"):
-                        section_id = "1.5"
-                    elif submodule["title"].startswith("1.6"):
-                        section_id = "1.6"
-                    else:
-                        # Default to standard output if no user-friendly explanation exists
-                        print_section_header(submodule["title"], submodule["description"])
-                        result = submodule["module"].run_all_audits()
-                        if not result:
-                            all_passed = False
-                        continue
-                    
-                    print_user_friendly_header(section_id, submodule["title"])
-                    
-                    # Capture the technical output
-                    original_stdout = sys.stdout
-                    sys.stdout = io.StringIO()
-                    
-                    # Run the actual checks
-                    results = submodule["module"].run_all_audits(return_results=True)
-                    
-                    # Restore stdout
-                    technical_output = sys.stdout.getvalue()
-                    sys.stdout = original_stdout
+    if action == "audit":
+        from concurrent.futures import Future, ThreadPoolExecutor
+        
+        all_passed = True
+        skipped = None
+        cache = ResultCache() if use_cache else None
+        fingerprints = {}
+        
+        # Run the audits concurrently, buffering each job's output, and print the
+        # buffers in submission order as soon as each one is ready
+        with thread_local_stdout() as proxy, \
+                ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs)))) as executor, \
+                (open(output_path, "a", buffering=1) if output_path else contextlib.nullcontext()) as output_file:
+            futures = []
+            for submodule, section_id in jobs:
+                cached = None
+                if cache is not None and submodule.get("inputs"):
+                    key = _cache_key(submodule, section_id)
+                    fingerprints[key] = ResultCache.fingerprint(submodule["inputs"])
+                    cached = cache.get(key, fingerprints[key])
+                
+                if cached is None:
+                    future = executor.submit(_audit_submodule, proxy, load_module(submodule), section_id is not None)
+                else:
+                    future = Future()
+                    future.set_result(cached)
+                futures.append(future)
+            
+            for done, ((submodule, section_id), future) in enumerate(zip(jobs, futures), 1):
+                results, technical_output = future.result()
+                
+                key = _cache_key(submodule, section_id)
+                if key in fingerprints and _audit_passed(results):
+                    cache.put(key, fingerprints[key], results, technical_output)
+                
+                if output_file is not None:
+                    _write_results(output_file, submodule, results)
+                
+                if section_id is None:
+                    # Standard technical output, also used when no user-friendly explanation exists
+                    print_section_header(submodule_title(submodule), submodule["description"])
+                    sys.stdout.write(technical_output)
+                    if not _audit_passed(results):
+                        all_passed = False
+                else:
+                    section_info = _get_explanations()[section_id]
+                    print_user_friendly_header(section_info, submodule_title(submodule))
                     
-                    # Process and display user-friendly results based on section_id
-                    if section_id == "1.1.1":
-                        # Filesystem kernel modules
-                        module_results = {
-                            "cramfs": next((r[1] for r in results if "1.1.1.1" in r[0]), False),
-                            "freevxfs": next((r[1] for r in results if "1.1.1.2" in r[0]), False),
-                            "jffs2": next((r[1] for r in results if "1.1.1.3" in r[0]), False),
-                            "hfs": next((r[1] for r in results if "1.1.1.4" in r[0]), False),
-                            "hfsplus": next((r[1] for r in results if "1.1.1.5" in r[0]), False),
-                            "squashfs": next((r[1] for r in results if "1.1.1.6" in r[0]), False),
-                            "udf": next((r[1] for r in results if "1.1.1.7" in r[0]), False),
-                            "fat": next((r[1] for r in results if "1.1.1.8" in r[0]), False)
-                        }
-                    elif section_id == "1.1.2":
-                        # Filesystem partitions
-                        module_results = {
-                            "/tmp partition": next((r[1] for r in results if "1.1.2.1" in r[0]), False),
-                            "/tmp nodev": next((r[1] for r in results if "1.1.2.2" in r[0]), False),
-                            "/tmp nosuid": next((r[1] for r in results if "1.1.2.3" in r[0]), False),
-                            "/tmp noexec": next((r[1] for r in results if "1.1.2.4" in r[0]), False),
-                            "/dev/shm partition": next((r[1] for r in results if "1.1.2.5" in r[0]), False),
-                            "/dev/shm nodev": next((r[1] for r in results if "1.1.2.6" in r[0]), False),
-                            "/dev/shm nosuid": next((r[1] for r in results if "1.1.2.7" in r[0]), False),
-                            "/dev/shm noexec": next((r[1] for r in results if "1.1.2.8" in r[0]), False)
-                        }
+                    # Index results by benchmark id once, then map each check to its result
+                    results_by_id = {description.split()[0]: status for description, status in results}
+                    module_results = {
+                        name: results_by_id.get(check_id, False)
+                        for check_id, name in submodule.get("checks", ())
+                    }
                     
-                    for module_name, result in module_results.items():
-                        explain_module_result(module_name, result, section_id)
+                    # Explanations and summary go out in a single write
+                    explanations = [
+                        format_module_result(module_name, result, section_info)
+                        for module_name, result in module_results.items()
+                    ]
                     
                     # Summary
                     passed = all(module_results.values())
                     if not passed:
                         all_passed = False
-                        
-                    print("\n" + "-" * 80)
+                    
+                    lines = ["".join(explanations) + "\n" + _BAR_DASH]
                     if passed:
-                        print(f"\n{COLORS['GREEN']}✅ Overall Result: SECURE{COLORS['RESET']}")
-                        print(f"{COLORS['GREEN']}All checks passed. Your system is properly configured.{COLORS['RESET']}")
+                        lines += _OVERALL_SECURE
                     else:
-                        print(f"\n{COLORS['YELLOW']}⚠️ Overall Result: VULNERABLE{COLORS['RESET']}")
-                        print(f"{COLORS['RED']}Some checks failed. Your system may be at risk.{COLORS['RESET']}")
-                        print("Recommendation: Run the remediation to address these issues.")
-                        print(f"Command: python3 cis_audit.py remediate {target_module}")
-                else:
-                    # Standard technical output
-                    print_section_header(submodule["title"], submodule["description"])
-                    # Call the module's run_all_audits function
-                    result = submodule["module"].run_all_audits()
-                    if not result:
-                        all_passed = False
+                        lines += _OVERALL_VULNERABLE
+                        lines.append(f"Command: python3 cis_audit.py remediate {target_args}")
+                    sys.stdout.write("\n".join(lines) + "\n")
+                
+                if fail_fast and not all_passed:
+                    # Drop the audits that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    skipped = len(jobs) - done
+                    break
+        
+        if cache is not None:
+            cache.save()
+        
+        if skipped is not None:
+            not_audited = f"; {skipped} later section(s) not audited" if skipped else ""
+            summary = (f"{YELLOW}⚠️  Stopped after the first failing section (--fail-fast){not_audited}. "
+                       f"Run with 'remediate' to fix issues.{RESET}")
+        elif all_passed:
+            summary = f"{GREEN}✅ All audits completed successfully. System is compliant with benchmarks.{RESET}"
+        else:
+            summary = f"{YELLOW}⚠️  All audits completed. Some checks failed. Run with 'remediate' to fix issues.{RESET}"
+        sys.stdout.write(f"\n{_BAR_EQ}\n\n{summary}\n")
+        
+        return all_passed and not missing
     
-    print("\n" + "=" * 80)
-    if all_passed:
-        print(f"\n{COLORS['GREEN']}✅ All audits completed successfully. System is compliant with benchmarks.{COLORS['RESET']}")
-    else:
-        print(f"\n{COLORS['YELLOW']}⚠️  All audits completed. Some checks failed. Run with 'remediate' to fix issues.{COLORS['RESET']}")
+    for submodule, section_id in jobs:
+        if section_id is not None:
+            section_info = _get_explanations()[section_id]
+            print_user_friendly_header(section_info, submodule_title(submodule))
+            
+            sys.stdout.write(f"\nApplying security fixes...\nWhat this will do: {section_info.remediation_explanation}\n")
+            
+            # Run the actual remediation
+            load_module(submodule).run_all_remediations()
+            
+            lines = [f"\n{GREEN}✅ Remediation completed!{RESET}"]
+            
+            if section_id == "1.1.1":
+                lines.append(f"{GREEN}The system has been secured against the identified vulnerabilities.{RESET}")
+            elif section_id == "1.1.2":
+                lines += [
+                    f"{YELLOW}Note: Filesystem partition remediations require manual intervention.{RESET}",
+                    f"{YELLOW}Please review the recommendations and apply them manually.{RESET}",
+                    f"{YELLOW}No automatic remediation is performed for these checks.{RESET}",
+                ]
+            
+            lines += ["\nTo verify that all issues have been fixed, run:", f"python3 cis_audit.py audit {target_args}"]
+            sys.stdout.write("\n".join(lines) + "\n")
+        else:
+            # Standard technical output, also used when no user-friendly explanation exists
+            print_section_header(submodule_title(submodule), submodule["description"])
+            # Call the module's run_all_remediations function
+            load_module(submodule).run_all_remediations()
     
-    return all_passed
+    sys.stdout.write(f"\n{_BAR_EQ}\n\n{GREEN}✅ Remediation completed. Run audit again to verify compliance.{RESET}\n")
+    return not missing
+
+
+def run_audits(target_module="all", user_friendly=True, concurrency=4, use_cache=False, output_path=None,
+               fail_fast=False):
+    """
+    Run audit functions from selected modules with user-friendly output by default
+
+    Submodule audits run concurrently on up to `concurrency` threads. Each one's
+    output is buffered and printed in MODULES order as soon as it is ready.
+    With use_cache, passing results of file-based checks are reused while
+    their inputs are unchanged. If output_path is given, each check's
+    result is appended to that file as one JSON object per line. With
+    fail_fast, the run stops after the first section that fails.
+    """
+    return _run(target_module, user_friendly, "audit", concurrency, use_cache, output_path, fail_fast)
 
 
 def run_remediations(target_module="all", user_friendly=True):
     """
     Run remediation functions from selected modules with user-friendly output by default
     """
-    print(f"\n🔧 Starting CIS Ubuntu 22.04 LTS Benchmark Remediation for {target_module}...\n")
-    
-    filtered_modules = filter_modules(target_module)
-    
-    if not filtered_modules:
-        print(f"Error: Module '{target_module}' not found.")
-        print("Available modules:")
-        for module_group in MODULES:
-            print(f"  - {module_group['name']} (group)")
-            for submodule in module_group["submodules"]:
-                print(f"    - {submodule['name']}")
-        return False
-    
-    for module_group in filtered_modules:
-        for submodule in module_group["submodules"]:
-            if submodule["module"] is not None:
-                if user_friendly:
-                    # Handle user-friendly output based on module title
-                    if submodule["title"].startswith("1.1.1"):
-                        section_id = "1.1.1"
-                    elif submodule["title"].startswith("1.1.2"):
-                        section_id = "1.1.2"
-                    elif submodule["title"].startswith("1.2.1"):
-                        section_id = "1.2.1"
-                    elif submodule["title"].startswith("1.2.2"):
-                        section_id = "1.2.2"
-                    elif submodule["title"].startswith("1.3.1"):
-                        section_id = "1.3.1"
-                    elif submodule["title"].startswith("1.4"):
-                        section_id = "1.4"
-                    elif submodule["title"].startswith("1.5"):
-                        section_id = "1.5"
-                    elif submodule["title"].startswith("1.6"):
-                        section_id = "1.6"
-                    else:
-                        # Default to standard output if no user-friendly explanation exists
-                        print_section_header(submodule["title"], submodule["description"])
-                        submodule["module"].run_all_remediations()
-                        continue
-                    
-                    section_info = USER_FRIENDLY_EXPLANATIONS.get(section_id, {})
-                    print_user_friendly_header(section_id, submodule["title"])
-                    
-                    print("\nApplying security fixes...")
-                    if section_info:
-                        print(f"What this will do: {section_info.get('remediation_explanation', '')}")
-                    
-                    # Run the actual remediation
-                    submodule["module"].run_all_remediations()
-                    
-                    print(f"\n{COLORS['GREEN']}✅ Remediation completed!{COLORS['RESET']}")
-                    
-                    if section_id == "1.1.1":
-                        print(f"{COLORS['GREEN']}The system has been secured against the identified vulnerabilities.{COLORS['RESET']}")
-                    elif section_id == "1.1.2":
-                        print(f"{COLORS['YELLOW']}Note: Filesystem partition remediations require manual intervention.{COLORS['RESET']}")
-                        print(f"{COLORS['YELLOW']}Please review the recommendations and apply them manually.{COLORS['RESET']}")
-                        print(f"{COLORS['YELLOW']}No automatic remediation is performed for these checks.{COLORS['RESET']}")
-                        
-                    print("\nTo verify that all issues have been fixed, run:")
-                    print(f"python3 cis_audit.py audit {target_module}")
-                else:
-                    # Standard technical output
-                    print_section_header(submodule["title"], submodule["description"])
-                    # Call the module's run_all_remediations function
-                    submodule["module"].run_all_remediations()
-    
-    print("\n" + "=" * 80)
-    print(f"\n{COLORS['GREEN']}✅ Remediation completed. Run audit again to verify compliance.{COLORS['RESET']}")
-    return True
+    return _run(target_module, user_friendly, "remediate")
 
 
-def list_available_modules():
+@functools.lru_cache(maxsize=1)
+def _available_modules_text():
     """
-    Print a formatted list of all available modules and submodules
+    Build the formatted list of all available modules and submodules once
     """
-    print("\nAvailable Modules:\n")
-    print("Module Groups:")
+    lines = ["\nAvailable Modules:\n", "Module Groups:"]
     for module_group in MODULES:
-        print(f"  - {module_group['name']}")
-        print(f"    Description: Group of modules for {module_group['name']} security checks")
-        print("    Submodules:")
+        lines += [
+            f"  - {module_group['name']}",
+            f"    Description: Group of modules for {module_group['name']} security checks",
+            "    Submodules:",
+        ]
         for submodule in module_group["submodules"]:
-            print(f"      - {submodule['name']}")
-            print(f"        Title: {submodule['title']}")
-            print(f"        Description: {submodule['description']}")
-        print()
+            lines += [
+                f"      - {submodule['name']}",
+                f"        Title: {submodule_title(submodule)}",
+                f"        Description: {submodule['description']}",
+            ]
+        lines.append("")
+    return "\n".join(lines) + "\n"
 
-def main():
+
+def list_available_modules():
     """
-    Main function to parse arguments and run appropriate functions
+    Print a formatted list of all available modules and submodules
     """
-    parser = argparse.ArgumentParser(
-        description="CIS Ubuntu 22.04 LTS Benchmark Audit and Remediation Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog='''
+    sys.stdout.write(_available_modules_text())
+
+_EPILOG = '''
 Examples:
   # Run all audit checks with user-friendly output
   python3 cis_audit.py audit
@@ -590,6 +893,34 @@ Examples:
   # List all available modules and submodules
   python3 cis_audit.py --help-modules
 '''
+
+
+def _positive_int(value):
+    """
+    Parse a command line value as an integer greater than zero
+    """
+    import argparse
+    
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build the command line parser once and reuse it on later calls
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="CIS Ubuntu 22.04 LTS Benchmark Audit and Remediation Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     # Add a mutually exclusive group for the main action vs. help-modules
@@ -600,35 +931,64 @@ Examples:
     parser.add_argument("module", nargs="?", default="all", help="Module to audit/remediate (default: all)")
     parser.add_argument("--technical", action="store_true", help="Display results in technical format instead of user-friendly format")
     parser.add_argument("--modules", nargs="+", help="Specify multiple modules to audit/remediate")
+    parser.add_argument("--concurrency", "--parallel", dest="concurrency", type=_positive_int, default=4, metavar="N",
+                        help="Number of submodule audits to run at the same time (default: 4)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse passing results of file-based audits from a root-only cache (requires root)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Append each audit result to PATH as a JSON line (audit only)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Stop auditing after the first section that fails")
+    
+    return parser
+
+
+def main(argv=None):
+    """
+    Main function to parse arguments and run appropriate functions
+    
+    argv defaults to the command line arguments; callers that drive the
+    controller from Python can pass their own list instead. Returns the exit
+    status: 0 when everything passed, 1 when a check failed or a module was
+    not found.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Print the usage straight from the docstring for bare or --help
+    # invocations, without building the argument parser
+    if not argv or argv[0] in ("-h", "--help"):
+        print(__doc__)
+        sys.exit(0 if argv else 2)
+    
+    parser = _build_parser()
+    args = parser.parse_args(argv)
     
-    args = parser.parse_args()
+    # Only audits produce per-check results to record
+    if args.output and args.action == "remediate":
+        parser.error("--output can only be used with the audit action")
+    
+    # The cache lives in a root-only directory so its verdicts cannot be forged
+    if args.cache and os.geteuid() != 0:
+        parser.error("--cache requires root")
     
     # Handle the --help-modules flag
     if args.help_modules:
         list_available_modules()
-        return
+        return 0
     
     # Default to user-friendly output unless --technical flag is specified
     user_friendly = not args.technical
     
-    # Handle multiple modules if specified with --modules
-    if args.modules:
-        all_passed = True
-        for module in args.modules:
-            if args.action == "audit":
-                result = run_audits(module, user_friendly)
-                if not result:
-                    all_passed = False
-            elif args.action == "remediate":
-                run_remediations(module, user_friendly)
-        return all_passed
+    # Run every module given with --modules in one pass, or the single
+    # module given as a positional argument
+    target = args.modules or args.module
+    if args.action == "audit":
+        passed = run_audits(target, user_friendly, args.concurrency, args.cache, args.output, args.fail_fast)
     else:
-        # Handle single module specified as positional argument
-        if args.action == "audit":
-            return run_audits(args.module, user_friendly)
-        elif args.action == "remediate":
-            return run_remediations(args.module, user_friendly)
+        passed = run_remediations(target, user_friendly)
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+"""
+CIS Ubuntu 22.04 LTS Benchmark - Shared Helpers
+
+This module holds helpers shared by the controller and the audit modules:
+- A thread-local stand-in for sys.stdout so concurrent audits can buffer
+  their output separately
+- A runner that executes independent checks concurrently while keeping
+  their output and results in order
+- Snapshots of the installed Debian packages and the GRUB defaults, read
+  once per run
+- The ANSI color codes used by the controller and every module, blanked
+  when output is not a terminal or NO_COLOR is set
+- The command runner used by every module
+"""
+
+import io
+import os
+import sys
+import shlex
+import functools
+import threading
+import contextlib
+
+
+# ANSI color codes
+COLORS = {
+    'GREEN': '\033[92m',  # Green for PASS
+    'RED': '\033[91m',    # Red for FAIL
+    'YELLOW': '\033[93m', # Yellow for warnings
+    'BLUE': '\033[94m',   # Blue for section headers
+    'RESET': '\033[0m'    # Reset to default color
+}
+
+# Disable colors when output is piped or logged, or when NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    COLORS = {key: "" for key in COLORS}
+
+
+def run_command(argv, timeout=5):
+    """
+    Run a command given as an argument list and return its output
+    
+    The command is executed directly rather than through /bin/sh, so callers
+    filter its output in Python instead of with pipes. A command that runs
+    longer than timeout seconds is killed and reported as failed, so one hung
+    tool cannot stall the whole audit.
+    """
+    import subprocess
+    
+    try:
+        result = subprocess.run(
+            argv,
+            shell=False,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout
+        )
+        return result.stdout.strip(), result.stderr.strip(), result.returncode
+    except Exception as e:
+        return "", str(e), 1
+
+
+
+class ThreadLocalStdout:
+    """
+    Stand-in for sys.stdout that sends writes from a capturing thread to that
+    thread's own buffer and everything else to the real stream
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    @contextlib.contextmanager
+    def redirect(self, stream):
+        """
+        Send the calling thread's writes to stream for the duration of the block
+        """
+        previous = getattr(self._local, "buffer", None)
+        self._local.buffer = stream
+        try:
+            yield stream
+        finally:
+            self._local.buffer = previous
+
+
+@contextlib.contextmanager
+def thread_local_stdout():
+    """
+    Install a ThreadLocalStdout for the duration of the block, reusing the
+    one already installed if there is one
+    """
+    if isinstance(sys.stdout, ThreadLocalStdout):
+        yield sys.stdout
+        return
+
+    original_stdout = sys.stdout
+    sys.stdout = ThreadLocalStdout(original_stdout)
+    try:
+        yield sys.stdout
+    finally:
+        sys.stdout = original_stdout
+
+
+def _run_check(proxy, check):
+    """
+    Run one check on a worker thread, buffering what it prints
+    """
+    with proxy.redirect(io.StringIO()) as buffer:
+        result = check()
+    return result, buffer.getvalue()
+
+
+def run_checks(checks, max_workers=8):
+    """
+    Run independent check functions concurrently
+
+    Each check's printed output is buffered and the buffers are written in
+    one go, in the order the checks were given, so the output matches a
+    sequential run.
+
+    Returns:
+        list: the checks' return values, in order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    results = []
+    outputs = []
+    with thread_local_stdout() as proxy, \
+            ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(checks)))) as executor:
+        futures = [executor.submit(_run_check, proxy, check) for check in checks]
+        for future in futures:
+            result, output = future.result()
+            results.append(result)
+            outputs.append(output)
+    sys.stdout.write("".join(outputs))
+    return results
+
+
+# dpkg's database of package states, and the status line of a fully installed package
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+_INSTALLED_STATUS = b"Status: install ok installed"
+
+
+@functools.lru_cache(maxsize=1)
+def installed_packages():
+    """
+    Return the names of all installed packages from one read of the dpkg
+    status database
+    
+    Returns:
+        frozenset: package names whose status is "install ok installed"
+    """
+    try:
+        with open(DPKG_STATUS_PATH, "rb") as status_file:
+            data = status_file.read()
+    except OSError:
+        return frozenset()
+    
+    # Each stanza starts with its Package line and has one Status line; match
+    # on the raw bytes and decode only the names that are kept
+    packages = set()
+    package = None
+    for line in data.splitlines():
+        if line.startswith(b"Package: "):
+            package = line[9:].strip()
+        elif line == _INSTALLED_STATUS and package is not None:
+            packages.add(package.decode())
+    return frozenset(packages)
+
+
+# GRUB's shell-style defaults file, sourced by update-grub
+GRUB_DEFAULTS_PATH = "/etc/default/grub"
+
+
+@functools.lru_cache(maxsize=1)
+def grub_config():
+    """
+    Return the variables set in /etc/default/grub from one read of the file
+    
+    Values are unquoted the way the shell would, and a variable assigned more
+    than once keeps its last value.
+    
+    Returns:
+        dict: variable name to value, empty if the file cannot be read
+    """
+    try:
+        with open(GRUB_DEFAULTS_PATH) as grub_file:
+            lines = grub_file.read().splitlines()
+    except OSError:
+        return {}
+    
+    config = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        name, value = line.split("=", 1)
+        if not name.isidentifier():
+            continue
+        try:
+            config[name] = " ".join(shlex.split(value, comments=True))
+        except ValueError:
+            config[name] = value
+    return config
@@ -12,36 +12,10 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
-import os
-import sys
-
-
-def _run_command(command):
-    """
-    Run a shell command and return its output
-    """
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+import re
+import functools
+
+from modules._common import COLORS, run_command as _run_command, grub_config, installed_packages
 
 
 def check_apparmor_installed():
@@ -52,9 +26,7 @@ def check_apparmor_installed():
     description = "Ensure AppArmor is installed (Automated)"
     
     # Check if AppArmor is installed
-    stdout, _, _ = _run_command("dpkg -s apparmor apparmor-utils 2>/dev/null | grep -E '^Status: install'")
-    
-    if len(stdout.splitlines()) >= 2:  # Both packages should be installed
+    if {"apparmor", "apparmor-utils"} <= installed_packages():  # Both packages should be installed
         print(f"{COLORS['GREEN']}[+] PASS: AppArmor and AppArmor utilities are installed{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
@@ -71,9 +43,9 @@ def check_apparmor_enabled_bootloader():
     description = "Ensure AppArmor is enabled in the bootloader configuration (Automated)"
     
     # Check if AppArmor is enabled in the bootloader
-    stdout, _, _ = _run_command("grep -E '^GRUB_CMDLINE_LINUX=' /etc/default/grub")
+    cmdline = set(grub_config().get("GRUB_CMDLINE_LINUX", "").split())
     
-    if "apparmor=1" in stdout and "security=apparmor" in stdout:
+    if {"apparmor=1", "security=apparmor"} <= cmdline:
         print(f"{COLORS['GREEN']}[+] PASS: AppArmor is enabled in the bootloader configuration{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
@@ -83,6 +55,31 @@ def check_apparmor_enabled_bootloader():
     return False, f"{benchmark_id} {description}", False
 
 
+# apparmor_status summary lines, e.g. "37 profiles are in enforce mode."
+_APPARMOR_COUNT_RE = re.compile(
+    r"^(\d+) (profiles are in enforce mode|profiles are in complain mode|processes are unconfined)",
+    re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _apparmor_counts():
+    """
+    Return the summary counts from one apparmor_status run, keyed by the
+    text that follows each count
+    """
+    # apparmor_status ships with the apparmor package, so only query it when that is installed
+    if "apparmor" not in installed_packages():
+        return {}
+    
+    # Take the first count reported for each summary line
+    stdout, _, _ = _run_command(["apparmor_status"])
+    counts = {}
+    for match in _APPARMOR_COUNT_RE.finditer(stdout):
+        counts.setdefault(match.group(2), int(match.group(1)))
+    return counts
+
+
 def check_apparmor_profiles_enforcing():
     """
     1.3.1.3 Ensure all AppArmor Profiles are in enforce or complain mode (Automated)
@@ -90,23 +87,10 @@ def check_apparmor_profiles_enforcing():
     benchmark_id = "1.3.1.3"
     description = "Ensure all AppArmor Profiles are in enforce or complain mode (Automated)"
     
-    # Check if any profiles are in complain mode
-    stdout, _, _ = _run_command("apparmor_status 2>/dev/null | grep -E '^([0-9]+) profiles are in complain mode'")
-    complain_count = 0
-    if stdout:
-        complain_count = int(stdout.split()[0])
-    
-    # Check if any profiles are in enforce mode
-    stdout, _, _ = _run_command("apparmor_status 2>/dev/null | grep -E '^([0-9]+) profiles are in enforce mode'")
-    enforce_count = 0
-    if stdout:
-        enforce_count = int(stdout.split()[0])
-    
-    # Check if any processes are unconfined
-    stdout, _, _ = _run_command("apparmor_status 2>/dev/null | grep -E '^([0-9]+) processes are unconfined'")
-    unconfined_count = 0
-    if stdout:
-        unconfined_count = int(stdout.split()[0])
+    counts = _apparmor_counts()
+    complain_count = counts.get("profiles are in complain mode", 0)
+    enforce_count = counts.get("profiles are in enforce mode", 0)
+    unconfined_count = counts.get("processes are unconfined", 0)
     
     if enforce_count > 0 or complain_count > 0:
         print(f"{COLORS['GREEN']}[+] PASS: AppArmor profiles are in enforce or complain mode{COLORS['RESET']}")
@@ -185,24 +169,20 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
-    results = []
-    
-    # Run all check functions
-    installed_result = check_apparmor_installed()
-    results.append(installed_result)
-    
-    bootloader_result = check_apparmor_enabled_bootloader()
-    results.append(bootloader_result)
-    
-    profiles_result = check_apparmor_profiles_enforcing()
-    results.append(profiles_result)
+    # Only the profile check runs a command, so there is nothing to overlap;
+    # run the checks one after another
+    results = [
+        check_apparmor_installed(),
+        check_apparmor_enabled_bootloader(),
+        check_apparmor_profiles_enforcing()
+    ]
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)
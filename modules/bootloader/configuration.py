@@ -12,37 +12,11 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
 import sys
 import stat
 
-
-def _run_command(command):
-    """
-    Run a shell command and return its output
-    """
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+from modules._common import COLORS
 
 
 def check_bootloader_password():
@@ -52,10 +26,14 @@ def check_bootloader_password():
     benchmark_id = "1.4.1"
     description = "Ensure bootloader password is set (Automated)"
     
-    # Check if GRUB password is configured
-    stdout, _, _ = _run_command("grep -E '^password|^password_pbkdf2' /boot/grub/grub.cfg")
+    # Check if GRUB password is configured (password_pbkdf2 also starts with "password")
+    try:
+        with open("/boot/grub/grub.cfg") as grub_cfg:
+            password_set = any(line.startswith("password") for line in grub_cfg)
+    except OSError:
+        password_set = False
     
-    if stdout:
+    if password_set:
         print(f"{COLORS['GREEN']}[+] PASS: Bootloader password is set{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
@@ -74,17 +52,17 @@ def check_bootloader_config_permissions():
     # Check permissions on /boot/grub/grub.cfg
     try:
         grub_stat = os.stat('/boot/grub/grub.cfg')
-        grub_mode = grub_stat.st_mode
+        grub_perms = grub_stat.st_mode & 0o777
         grub_owner = grub_stat.st_uid
         grub_group = grub_stat.st_gid
         
         # Check if permissions are 400 (read-only for owner) and owner/group is root
-        if (grub_mode & 0o777) == 0o400 and grub_owner == 0 and grub_group == 0:
+        if grub_perms == 0o400 and grub_owner == 0 and grub_group == 0:
             print(f"{COLORS['GREEN']}[+] PASS: Bootloader config has secure permissions{COLORS['RESET']}")
             return True, f"{benchmark_id} {description}", True
         
         print(f"{COLORS['RED']}[-] FAIL: Bootloader config has insecure permissions{COLORS['RESET']}")
-        print(f"    Current permissions: {oct(grub_mode & 0o777)}")
+        print(f"    Current permissions: {oct(grub_perms)}")
         print(f"    Current owner/group: {grub_owner}/{grub_group}")
         print(f"    Remediation: Run 'sudo chmod 400 /boot/grub/grub.cfg' and 'sudo chown root:root /boot/grub/grub.cfg'")
         return False, f"{benchmark_id} {description}", False
@@ -145,21 +123,18 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
-    results = []
-    
-    # Run all check functions
-    password_result = check_bootloader_password()
-    results.append(password_result)
-    
-    permissions_result = check_bootloader_config_permissions()
-    results.append(permissions_result)
+    # The checks only read grub.cfg, so run them one after another
+    results = [
+        check_bootloader_password(),
+        check_bootloader_config_permissions()
+    ]
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)
@@ -12,68 +12,46 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
 import sys
 import re
 
-
-def _run_command(command):
-    """
-    Run a shell command and return its output
-    """
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+from modules._common import COLORS
 
 
 def _check_file_permissions(file_path, expected_permissions):
     """
     Check if a file has the expected permissions
     """
-    stdout, _, _ = _run_command(f"stat -c '%a %u %g' {file_path} 2>/dev/null")
-    if not stdout:
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return False, f"File {file_path} does not exist"
     
-    parts = stdout.split()
-    if len(parts) != 3:
-        return False, f"Unexpected output from stat command: {stdout}"
-    
-    actual_perms, owner, group = parts
+    # Octal permission bits as stat -c %a prints them, e.g. "644"
+    actual_perms = format(st.st_mode & 0o7777, "o")
     
     # Check if permissions match expected
     if actual_perms != expected_permissions:
         return False, f"File {file_path} has permissions {actual_perms}, expected {expected_permissions}"
     
     # Check if owner is root (0)
-    if owner != "0":
-        return False, f"File {file_path} is owned by UID {owner}, expected 0 (root)"
+    if st.st_uid != 0:
+        return False, f"File {file_path} is owned by UID {st.st_uid}, expected 0 (root)"
     
     # Check if group is root (0)
-    if group != "0":
-        return False, f"File {file_path} has group GID {group}, expected 0 (root)"
+    if st.st_gid != 0:
+        return False, f"File {file_path} has group GID {st.st_gid}, expected 0 (root)"
     
     return True, ""
 
 
+# Words that reveal OS or version details and must not appear in a banner
+_BANNER_RESTRICTED_RE = re.compile(
+    r'\b(OS|version|release|Ubuntu|Debian|Linux|kernel|welcome)\b', re.IGNORECASE
+)
+
+
 def _check_banner_content(file_path):
     """
     Check if a banner file contains appropriate content
@@ -83,14 +61,9 @@ def _check_banner_content(file_path):
             content = f.read()
         
         # Check if content contains any of the restricted strings
-        restricted_patterns = [
-            r'\bOS\b', r'\bversion\b', r'\brelease\b', r'\bUbuntu\b', 
-            r'\bDebian\b', r'\bLinux\b', r'\bkernel\b', r'\bwelcome\b'
-        ]
-        
-        for pattern in restricted_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return False, f"Banner contains restricted information (matching '{pattern}')"
+        match = _BANNER_RESTRICTED_RE.search(content)
+        if match:
+            return False, f"Banner contains restricted information (matching '{match.group(1)}')"
         
         # Check if content is not empty and contains some warning text
         if len(content.strip()) < 20:
@@ -109,9 +82,7 @@ def check_message_of_the_day():
     description = "Ensure message of the day is configured properly (Automated)"
     
     # Check if /etc/motd exists and has proper permissions
-    motd_exists, _ = _run_command("test -f /etc/motd && echo 'exists' || echo 'not exists'")
-    
-    if motd_exists == "exists":
+    if os.path.isfile("/etc/motd"):
         # Check permissions
         perms_ok, perms_msg = _check_file_permissions("/etc/motd", "644")
         
@@ -131,9 +102,12 @@ def check_message_of_the_day():
             return False, f"{benchmark_id} {description}", False
     else:
         # If /etc/motd doesn't exist, check if the dynamic motd is properly configured
-        dynamic_motd, _, _ = _run_command("ls -la /etc/update-motd.d/ 2>/dev/null | wc -l")
+        try:
+            has_dynamic_motd = len(os.listdir("/etc/update-motd.d")) > 0
+        except OSError:
+            has_dynamic_motd = False
         
-        if int(dynamic_motd.strip()) > 2:  # More than . and .. entries
+        if has_dynamic_motd:
             print(f"{COLORS['GREEN']}[+] PASS: Dynamic message of the day is configured{COLORS['RESET']}")
             return True, f"{benchmark_id} {description}", True
         else:
@@ -142,71 +116,42 @@ def check_message_of_the_day():
             return False, f"{benchmark_id} {description}", False
 
 
-def check_local_login_warning():
-    """
-    1.6.2 Ensure local login warning banner is configured properly (Automated)
-    """
-    benchmark_id = "1.6.2"
-    description = "Ensure local login warning banner is configured properly (Automated)"
-    
-    # Check if /etc/issue exists
-    file_exists, _, _ = _run_command("test -f /etc/issue && echo 'exists' || echo 'not exists'")
-    
-    if file_exists != "exists":
-        print(f"{COLORS['RED']}[-] FAIL: Local login warning banner (/etc/issue) does not exist{COLORS['RESET']}")
-        print(f"    Remediation: Create /etc/issue with proper permissions and content")
-        return False, f"{benchmark_id} {description}", False
-    
-    # Check permissions
-    perms_ok, perms_msg = _check_file_permissions("/etc/issue", "644")
-    
-    # Check content
-    content_ok, content_msg = _check_banner_content("/etc/issue")
-    
-    if perms_ok and content_ok:
-        print(f"{COLORS['GREEN']}[+] PASS: Local login warning banner is configured properly{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    else:
-        print(f"{COLORS['RED']}[-] FAIL: Local login warning banner is not configured properly{COLORS['RESET']}")
-        if not perms_ok:
-            print(f"    {perms_msg}")
-        if not content_ok:
-            print(f"    {content_msg}")
-        print(f"    Remediation: Configure /etc/issue with proper permissions and content")
-        return False, f"{benchmark_id} {description}", False
+# Login warning banners: (benchmark_id, "local" or "remote", banner file)
+LOGIN_BANNER_CHECKS = (
+    ("1.6.2", "local", "/etc/issue"),
+    ("1.6.3", "remote", "/etc/issue.net"),
+)
 
 
-def check_remote_login_warning():
+def check_login_banner(benchmark_id, kind, banner_path):
     """
-    1.6.3 Ensure remote login warning banner is configured properly (Automated)
+    1.6.2 / 1.6.3 Ensure local/remote login warning banner is configured properly (Automated)
     """
-    benchmark_id = "1.6.3"
-    description = "Ensure remote login warning banner is configured properly (Automated)"
+    description = f"Ensure {kind} login warning banner is configured properly (Automated)"
+    banner_name = f"{kind.capitalize()} login warning banner"
     
-    # Check if /etc/issue.net exists
-    file_exists, _, _ = _run_command("test -f /etc/issue.net && echo 'exists' || echo 'not exists'")
-    
-    if file_exists != "exists":
-        print(f"{COLORS['RED']}[-] FAIL: Remote login warning banner (/etc/issue.net) does not exist{COLORS['RESET']}")
-        print(f"    Remediation: Create /etc/issue.net with proper permissions and content")
+    # Check if the banner file exists
+    if not os.path.isfile(banner_path):
+        print(f"{COLORS['RED']}[-] FAIL: {banner_name} ({banner_path}) does not exist{COLORS['RESET']}")
+        print(f"    Remediation: Create {banner_path} with proper permissions and content")
         return False, f"{benchmark_id} {description}", False
     
     # Check permissions
-    perms_ok, perms_msg = _check_file_permissions("/etc/issue.net", "644")
+    perms_ok, perms_msg = _check_file_permissions(banner_path, "644")
     
     # Check content
-    content_ok, content_msg = _check_banner_content("/etc/issue.net")
+    content_ok, content_msg = _check_banner_content(banner_path)
     
     if perms_ok and content_ok:
-        print(f"{COLORS['GREEN']}[+] PASS: Remote login warning banner is configured properly{COLORS['RESET']}")
+        print(f"{COLORS['GREEN']}[+] PASS: {banner_name} is configured properly{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     else:
-        print(f"{COLORS['RED']}[-] FAIL: Remote login warning banner is not configured properly{COLORS['RESET']}")
+        print(f"{COLORS['RED']}[-] FAIL: {banner_name} is not configured properly{COLORS['RESET']}")
         if not perms_ok:
             print(f"    {perms_msg}")
         if not content_ok:
             print(f"    {content_msg}")
-        print(f"    Remediation: Configure /etc/issue.net with proper permissions and content")
+        print(f"    Remediation: Configure {banner_path} with proper permissions and content")
         return False, f"{benchmark_id} {description}", False
 
 
@@ -218,7 +163,11 @@ def check_access_to_etc_issue():
     description = "Ensure access to the su command is restricted (Automated)"
     
     # Check if pam_wheel.so is configured in /etc/pam.d/su
-    stdout, _, _ = _run_command("grep pam_wheel.so /etc/pam.d/su")
+    try:
+        with open("/etc/pam.d/su") as pam_file:
+            stdout = "".join(line for line in pam_file if "pam_wheel.so" in line).strip()
+    except OSError:
+        stdout = ""
     
     if "auth required pam_wheel.so use_uid group=sudo" in stdout and not stdout.strip().startswith("#"):
         print(f"{COLORS['GREEN']}[+] PASS: Access to the su command is restricted{COLORS['RESET']}")
@@ -318,27 +267,19 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
-    results = []
-    
-    # Run all check functions
-    motd_result = check_message_of_the_day()
-    results.append(motd_result)
-    
-    local_login_result = check_local_login_warning()
-    results.append(local_login_result)
-    
-    remote_login_result = check_remote_login_warning()
-    results.append(remote_login_result)
-    
-    su_access_result = check_access_to_etc_issue()
-    results.append(su_access_result)
+    # The checks only read a few small files, so run them one after another
+    results = [
+        check_message_of_the_day(),
+        *(check_login_banner(*check) for check in LOGIN_BANNER_CHECKS),
+        check_access_to_etc_issue()
+    ]
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)
@@ -12,36 +12,67 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
+import re
 import sys
+import functools
+
+if __name__ == "__main__":
+    # Allow running this file directly by putting the repository root on the import path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from modules._common import COLORS
 
-def _run_command(command):
+
+# Octal escapes such as \040 (space) that the kernel uses in mountinfo paths
+_MOUNTINFO_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
+
+
+def _unescape_mount_field(field):
     """
-    Run a shell command and return its output
+    Decode the octal escapes in a /proc/self/mountinfo field
+    """
+    return _MOUNTINFO_ESCAPE_RE.sub(lambda match: chr(int(match.group(1), 8)), field)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mounts():
+    """
+    Get every mounted filesystem from a single read of /proc/self/mountinfo
+    
+    Returns:
+        dict: mount point -> (device, frozenset of mount options)
     """
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+        with open("/proc/self/mountinfo") as mountinfo:
+            lines = mountinfo.read().splitlines()
+    except OSError:
+        return {}
+    
+    mounts = {}
+    for line in lines:
+        # <id> <parent> <major:minor> <root> <mount point> <mount options> [optional...] - <fstype> <source> <super options>
+        fields = line.split()
+        try:
+            separator = fields.index("-", 6)
+            mount_point, mount_options = fields[4], fields[5]
+            source, super_options = fields[separator + 2], fields[separator + 3]
+        except (ValueError, IndexError):
+            continue
+        
+        # Later entries are mounted over earlier ones on the same target
+        mounts[_unescape_mount_field(mount_point)] = (
+            _unescape_mount_field(source),
+            frozenset(mount_options.split(",")) | frozenset(super_options.split(",")),
         )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+    return mounts
+
+
+def clear_caches():
+    """
+    Forget the cached mount table so the next check re-reads it
+    """
+    _get_mounts.cache_clear()
 
 
 def _get_mount_info(mount_point):
@@ -51,34 +82,29 @@ def _get_mount_info(mount_point):
     Returns:
         tuple: (is_mounted, mount_options, device)
     """
-    stdout, _, _ = _run_command(f"findmnt -n {mount_point}")
-    if not stdout:
-        return False, [], ""
+    mount = _get_mounts().get(mount_point)
+    if mount is None:
+        return False, frozenset(), ""
     
-    # Parse the output
-    # Example output: /tmp   tmpfs   tmpfs   rw,nosuid,nodev,noexec,relatime
-    parts = stdout.split()
-    if len(parts) >= 4:
-        device = parts[1]
-        options = parts[3].split(',')
-        return True, options, device
-    
-    return True, [], ""
+    device, options = mount
+    return True, options, device
 
 
 def _is_separate_partition(mount_point):
     """
     Check if a mount point is on a separate partition
     """
+    if not _get_mounts():
+        # No mount table (e.g. /proc is not mounted): a mount point has a
+        # different device from its parent directory
+        return os.path.ismount(mount_point)
+    
     is_mounted, _, device = _get_mount_info(mount_point)
     if not is_mounted:
         return False
     
     # Check if it's not the root filesystem
-    root_device = ""
-    stdout, _, _ = _run_command("findmnt -n /")
-    if stdout:
-        root_device = stdout.split()[1]
+    _, _, root_device = _get_mount_info("/")
     
     return device != root_device and device != ""
 
@@ -94,56 +120,29 @@ def _has_option(mount_point, option):
     return option in options
 
 
-def check_tmp_partition():
-    """
-    1.1.2.1 Ensure /tmp is a separate partition
-    """
-    benchmark_id = "1.1.2.1"
-    description = "Ensure /tmp is a separate partition"
-    mount_point = "/tmp"
-    
-    if _is_separate_partition(mount_point):
-        print(f"{COLORS['GREEN']}[+] PASS: {mount_point} is mounted on a separate partition{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {mount_point} is not mounted on a separate partition{COLORS['RESET']}")
-    print(f"    Remediation: Create a separate partition for {mount_point} and update /etc/fstab")
-    return False, f"{benchmark_id} {description}", False
-
+# Mount options required on each mount point: mount point -> ((benchmark_id, option), ...)
+MOUNT_OPTION_CHECKS = {
+    "/tmp": (("1.1.2.2", "nodev"), ("1.1.2.3", "nosuid"), ("1.1.2.4", "noexec")),
+    "/dev/shm": (("1.1.2.6", "nodev"), ("1.1.2.7", "nosuid"), ("1.1.2.8", "noexec")),
+}
 
-def check_tmp_nodev():
-    """
-    1.1.2.2 Ensure nodev option set on /tmp partition
-    """
-    benchmark_id = "1.1.2.2"
-    description = "Ensure nodev option set on /tmp partition"
-    mount_point = "/tmp"
-    option = "nodev"
-    
-    if not _is_separate_partition(mount_point):
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not a separate partition, skipping {option} check{COLORS['RESET']}")
-        return False, f"{benchmark_id} {description}", False
-    
-    if _has_option(mount_point, option):
-        print(f"{COLORS['GREEN']}[+] PASS: {option} option is set on {mount_point}{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {option} option is not set on {mount_point}{COLORS['RESET']}")
-    print(f"    Remediation: Add the {option} option to the {mount_point} entry in /etc/fstab")
-    return False, f"{benchmark_id} {description}", False
+# Mount points whose options are only checked once they are separate partitions;
+# the others only need to be mounted
+_SEPARATE_PARTITIONS = {"/tmp"}
 
 
-def check_tmp_nosuid():
+def check_mount_option(benchmark_id, mount_point, option):
     """
-    1.1.2.3 Ensure nosuid option set on /tmp partition
+    1.1.2.x Ensure <option> option set on <mount_point> partition
     """
-    benchmark_id = "1.1.2.3"
-    description = "Ensure nosuid option set on /tmp partition"
-    mount_point = "/tmp"
-    option = "nosuid"
+    description = f"Ensure {option} option set on {mount_point} partition"
     
-    if not _is_separate_partition(mount_point):
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not a separate partition, skipping {option} check{COLORS['RESET']}")
+    if mount_point in _SEPARATE_PARTITIONS:
+        if not _is_separate_partition(mount_point):
+            print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not a separate partition, skipping {option} check{COLORS['RESET']}")
+            return False, f"{benchmark_id} {description}", False
+    elif not _get_mount_info(mount_point)[0]:
+        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not properly configured, skipping {option} check{COLORS['RESET']}")
         return False, f"{benchmark_id} {description}", False
     
     if _has_option(mount_point, option):
@@ -155,25 +154,20 @@ def check_tmp_nosuid():
     return False, f"{benchmark_id} {description}", False
 
 
-def check_tmp_noexec():
+def check_tmp_partition():
     """
-    1.1.2.4 Ensure noexec option set on /tmp partition
+    1.1.2.1 Ensure /tmp is a separate partition
     """
-    benchmark_id = "1.1.2.4"
-    description = "Ensure noexec option set on /tmp partition"
+    benchmark_id = "1.1.2.1"
+    description = "Ensure /tmp is a separate partition"
     mount_point = "/tmp"
-    option = "noexec"
-    
-    if not _is_separate_partition(mount_point):
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not a separate partition, skipping {option} check{COLORS['RESET']}")
-        return False, f"{benchmark_id} {description}", False
     
-    if _has_option(mount_point, option):
-        print(f"{COLORS['GREEN']}[+] PASS: {option} option is set on {mount_point}{COLORS['RESET']}")
+    if _is_separate_partition(mount_point):
+        print(f"{COLORS['GREEN']}[+] PASS: {mount_point} is mounted on a separate partition{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
-    print(f"{COLORS['RED']}[-] FAIL: {option} option is not set on {mount_point}{COLORS['RESET']}")
-    print(f"    Remediation: Add the {option} option to the {mount_point} entry in /etc/fstab")
+    print(f"{COLORS['RED']}[-] FAIL: {mount_point} is not mounted on a separate partition{COLORS['RESET']}")
+    print(f"    Remediation: Create a separate partition for {mount_point} and update /etc/fstab")
     return False, f"{benchmark_id} {description}", False
 
 
@@ -195,75 +189,6 @@ def check_dev_shm_partition():
     return False, f"{benchmark_id} {description}", False
 
 
-def check_dev_shm_nodev():
-    """
-    1.1.2.6 Ensure nodev option set on /dev/shm partition
-    """
-    benchmark_id = "1.1.2.6"
-    description = "Ensure nodev option set on /dev/shm partition"
-    mount_point = "/dev/shm"
-    option = "nodev"
-    
-    is_mounted, _, _ = _get_mount_info(mount_point)
-    if not is_mounted:
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not properly configured, skipping {option} check{COLORS['RESET']}")
-        return False, f"{benchmark_id} {description}", False
-    
-    if _has_option(mount_point, option):
-        print(f"{COLORS['GREEN']}[+] PASS: {option} option is set on {mount_point}{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {option} option is not set on {mount_point}{COLORS['RESET']}")
-    print(f"    Remediation: Add the {option} option to the {mount_point} entry in /etc/fstab")
-    return False, f"{benchmark_id} {description}", False
-
-
-def check_dev_shm_nosuid():
-    """
-    1.1.2.7 Ensure nosuid option set on /dev/shm partition
-    """
-    benchmark_id = "1.1.2.7"
-    description = "Ensure nosuid option set on /dev/shm partition"
-    mount_point = "/dev/shm"
-    option = "nosuid"
-    
-    is_mounted, _, _ = _get_mount_info(mount_point)
-    if not is_mounted:
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not properly configured, skipping {option} check{COLORS['RESET']}")
-        return False, f"{benchmark_id} {description}", False
-    
-    if _has_option(mount_point, option):
-        print(f"{COLORS['GREEN']}[+] PASS: {option} option is set on {mount_point}{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {option} option is not set on {mount_point}{COLORS['RESET']}")
-    print(f"    Remediation: Add the {option} option to the {mount_point} entry in /etc/fstab")
-    return False, f"{benchmark_id} {description}", False
-
-
-def check_dev_shm_noexec():
-    """
-    1.1.2.8 Ensure noexec option set on /dev/shm partition
-    """
-    benchmark_id = "1.1.2.8"
-    description = "Ensure noexec option set on /dev/shm partition"
-    mount_point = "/dev/shm"
-    option = "noexec"
-    
-    is_mounted, _, _ = _get_mount_info(mount_point)
-    if not is_mounted:
-        print(f"{COLORS['YELLOW']}[!] WARN: {mount_point} is not properly configured, skipping {option} check{COLORS['RESET']}")
-        return False, f"{benchmark_id} {description}", False
-    
-    if _has_option(mount_point, option):
-        print(f"{COLORS['GREEN']}[+] PASS: {option} option is set on {mount_point}{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {option} option is not set on {mount_point}{COLORS['RESET']}")
-    print(f"    Remediation: Add the {option} option to the {mount_point} entry in /etc/fstab")
-    return False, f"{benchmark_id} {description}", False
-
-
 # Removed individual remediation functions as they are no longer needed.
 # All remediation suggestions are now provided in the run_all_remediations function.
 
@@ -281,18 +206,18 @@ def run_all_audits(return_results=False):
     """
     print(f"{COLORS['BLUE']}Running Filesystem Partition Configuration Audits...{COLORS['RESET']}")
     
+    # Re-read the mount table once per audit run, so an audit after a remount
+    # or a remediation in the same process does not verify against stale data
+    clear_caches()
+    
     results = [
         check_tmp_partition(),
-        check_tmp_nodev(),
-        check_tmp_nosuid(),
-        check_tmp_noexec(),
+        *(check_mount_option(benchmark_id, "/tmp", option) for benchmark_id, option in MOUNT_OPTION_CHECKS["/tmp"]),
         check_dev_shm_partition(),
-        check_dev_shm_nodev(),
-        check_dev_shm_nosuid(),
-        check_dev_shm_noexec()
+        *(check_mount_option(benchmark_id, "/dev/shm", option) for benchmark_id, option in MOUNT_OPTION_CHECKS["/dev/shm"])
     ]
     
-    # Count passes and fails
+    # Count passes and fails once; the return value reuses the count
     passes = sum(1 for result in results if result[0])
     fails = len(results) - passes
     
@@ -306,7 +231,7 @@ def run_all_audits(return_results=False):
         # Return a list of tuples (benchmark_id_description, result)
         return [(result[1], result[2]) for result in results]
     
-    return all(result[0] for result in results)
+    return fails == 0
 
 
 def run_all_remediations():
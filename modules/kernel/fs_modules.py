@@ -12,377 +12,221 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
 import sys
+import re
+import functools
+
+if __name__ == "__main__":
+    # Allow running this file directly by putting the repository root on the import path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from modules._common import COLORS, run_checks
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_executable(name):
+    """
+    Resolve a command name to its absolute path once, falling back to the name
+    """
+    import shutil
+    
+    return shutil.which(name) or name
 
 
-def _run_command(command):
+def _run_command(argv, timeout=5):
     """
-    Run a shell command and return its output
+    Run a command, given as an argument list, without a shell and return its
+    raw output as bytes
+    
+    A command that runs longer than timeout seconds is killed and reported as
+    failed, so one hung tool cannot stall the whole audit. The executable is
+    given by absolute path with close_fds=False so subprocess can start it
+    with posix_spawn rather than fork and exec.
     """
+    import subprocess
+    
     try:
         result = subprocess.run(
-            command,
-            shell=True,
+            [_resolve_executable(argv[0]), *argv[1:]],
+            shell=False,
+            close_fds=False,
             check=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True
+            timeout=timeout
         )
         return result.stdout.strip(), result.stderr.strip(), result.returncode
     except Exception as e:
-        return "", str(e), 1
-
-
-def _is_module_loaded(module_name):
-    """
-    Check if a kernel module is loaded
-    """
-    stdout, _, _ = _run_command(f"lsmod | grep {module_name}")
-    return bool(stdout)
+        return b"", str(e).encode(), 1
 
 
-def _is_module_available(module_name):
+def clear_caches():
     """
-    Check if a kernel module is available to be loaded
+    Forget the cached module availability and modprobe configuration so the
+    next check re-reads them
     """
-    stdout, _, _ = _run_command(f"modprobe -n -v {module_name}")
-    return not ("not found" in stdout or "No such file or directory" in stdout)
+    _is_module_available.cache_clear()
+    _modprobe_config.cache_clear()
+    _disabled_modules.cache_clear()
 
 
-def _is_module_disabled(module_name):
+def _is_module_loaded(module_name):
     """
-    Check if a kernel module is disabled via modprobe config
+    Check if a kernel module is loaded
     """
-    stdout, _, _ = _run_command(f"modprobe -n -v {module_name}")
-    return "install /bin/true" in stdout or "install /bin/false" in stdout
+    # Only loaded loadable modules have an initstate entry in sysfs (built-in
+    # modules with parameters also get a /sys/module directory, but no initstate).
+    # The kernel names modules with underscores, e.g. usb-storage as usb_storage
+    return os.path.exists(f"/sys/module/{module_name.replace('-', '_')}/initstate")
 
 
-def _disable_module(module_name):
-    """
-    Disable a kernel module by creating a .conf file in /etc/modprobe.d/
-    """
-    conf_file = f"/etc/modprobe.d/disable-{module_name}.conf"
-    command = f"echo 'install {module_name} /bin/true' > {conf_file}"
-    stdout, stderr, rc = _run_command(command)
-    return rc == 0
+# modprobe output showing a module does not exist, matched on the raw bytes
+_MODULE_NOT_FOUND = b"not found"
+_MODULE_MISSING_MARKERS = (_MODULE_NOT_FOUND, b"No such file or directory")
 
 
-def check_cramfs():
-    """
-    1.1.1.1 Ensure cramfs kernel module is not available
-    """
-    module_name = "cramfs"
-    benchmark_id = "1.1.1.1"
-    description = f"Ensure {module_name} kernel module is not available"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"{benchmark_id} {description}", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"{benchmark_id} {description}", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"{benchmark_id} {description}", False
-
-
-def remediate_cramfs():
+@functools.lru_cache(maxsize=None)
+def _is_module_available(module_name):
     """
-    Remediate 1.1.1.1 Ensure cramfs kernel module is not available
+    Check if a kernel module is available to be loaded
     """
-    module_name = "cramfs"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.1 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+    stdout, stderr, _ = _run_command(["modprobe", "-n", "-v", module_name])
+    if any(marker in stdout for marker in _MODULE_MISSING_MARKERS):
+        return False
+    # modprobe reports a missing module on stderr: "FATAL: Module <name> not found ..."
+    return _MODULE_NOT_FOUND not in stderr
 
 
-def check_freevxfs():
-    """
-    1.1.1.2 Ensure freevxfs kernel module is not available
-    """
-    module_name = "freevxfs"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.2 Ensure {module_name} kernel module is not available", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.2 Ensure {module_name} kernel module is not available", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.2 Ensure {module_name} kernel module is not available", False
+# Directories whose *.conf files make up the modprobe configuration
+_MODPROBE_CONFIG_DIRS = ("/etc/modprobe.d", "/run/modprobe.d", "/lib/modprobe.d")
 
 
-def remediate_freevxfs():
+@functools.lru_cache(maxsize=1)
+def _modprobe_config():
     """
-    Remediate 1.1.1.2 Ensure freevxfs kernel module is not available
+    Read every modprobe configuration file once and return their combined text
     """
-    module_name = "freevxfs"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.2 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
+    # One directory listing per configuration directory
+    paths = []
+    for directory in _MODPROBE_CONFIG_DIRS:
+        try:
+            with os.scandir(directory) as entries:
+                paths += [entry.path for entry in entries if entry.name.endswith(".conf")]
+        except OSError:
+            continue
+    paths.append("/etc/modprobe.conf")
     
-    return True
+    contents = []
+    for path in paths:
+        try:
+            with open(path) as config_file:
+                contents.append(config_file.read())
+        except OSError:
+            continue
+    return "\n".join(contents)
 
 
-def check_jffs2():
-    """
-    1.1.1.3 Ensure jffs2 kernel module is not available
-    """
-    module_name = "jffs2"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.3 Ensure {module_name} kernel module is not available", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.3 Ensure {module_name} kernel module is not available", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.3 Ensure {module_name} kernel module is not available", False
+# "install <module> /bin/true" (or /bin/false) lines that stop a module loading
+_MODPROBE_INSTALL_RE = re.compile(r"^\s*install\s+(\S+)\s+/bin/(?:true|false)\b", re.MULTILINE)
 
 
-def remediate_jffs2():
+@functools.lru_cache(maxsize=1)
+def _disabled_modules():
     """
-    Remediate 1.1.1.3 Ensure jffs2 kernel module is not available
+    Return the set of module names disabled in the modprobe configuration
     """
-    module_name = "jffs2"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.3 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+    return {
+        match.group(1).replace("-", "_")
+        for match in _MODPROBE_INSTALL_RE.finditer(_modprobe_config())
+    }
 
 
-def check_hfs():
-    """
-    1.1.1.4 Ensure hfs kernel module is not available
-    """
-    module_name = "hfs"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.4 Ensure {module_name} kernel module is not available", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.4 Ensure {module_name} kernel module is not available", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.4 Ensure {module_name} kernel module is not available", False
-
-
-def remediate_hfs():
+def _is_module_disabled(module_name):
     """
-    Remediate 1.1.1.4 Ensure hfs kernel module is not available
+    Check if a kernel module is disabled via modprobe config
     """
-    module_name = "hfs"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.4 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+    return module_name.replace("-", "_") in _disabled_modules()
 
 
-def check_hfsplus():
-    """
-    1.1.1.5 Ensure hfsplus kernel module is not available
-    """
-    module_name = "hfsplus"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.5 Ensure {module_name} kernel module is not available", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.5 Ensure {module_name} kernel module is not available", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.5 Ensure {module_name} kernel module is not available", False
-
-
-def remediate_hfsplus():
-    """
-    Remediate 1.1.1.5 Ensure hfsplus kernel module is not available
-    """
-    module_name = "hfsplus"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.5 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+# Benchmarks in this section: (benchmark_id, name in the description, kernel modules checked)
+# A module that depends on another is listed after it
+KERNEL_MODULE_CHECKS = (
+    ("1.1.1.1", "cramfs", ("cramfs",)),
+    ("1.1.1.2", "freevxfs", ("freevxfs",)),
+    ("1.1.1.3", "jffs2", ("jffs2",)),
+    ("1.1.1.4", "hfs", ("hfs",)),
+    ("1.1.1.5", "hfsplus", ("hfsplus",)),
+    ("1.1.1.6", "squashfs", ("squashfs",)),
+    ("1.1.1.7", "udf", ("udf",)),
+    ("1.1.1.8", "FAT", ("fat", "vfat")),
+)
 
 
-def check_squashfs():
+def _audit_kernel_module(module_name):
     """
-    1.1.1.6 Ensure squashfs kernel module is not available
+    Print the audit status of a single kernel module and return whether it passes
     """
-    module_name = "squashfs"
-    
     if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.6 Ensure {module_name} kernel module is not available", False
+        sys.stdout.write(
+            f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}\n"
+            f"    Remediation: Run 'rmmod {module_name}' to unload the module\n"
+        )
+        return False
     
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
+    # The disabled check is a lookup in the cached modprobe configuration, so try
+    # it before forking modprobe to probe availability
+    if _is_module_disabled(module_name) or not _is_module_available(module_name):
         print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.6 Ensure {module_name} kernel module is not available", True
-    
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.6 Ensure {module_name} kernel module is not available", False
-
-
-def remediate_squashfs():
-    """
-    Remediate 1.1.1.6 Ensure squashfs kernel module is not available
-    """
-    module_name = "squashfs"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.6 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
+        return True
     
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+    sys.stdout.write(
+        f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}\n"
+        f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file\n"
+    )
+    return False
 
 
-def check_udf():
+def check_kernel_module(benchmark_id, name, module_names):
     """
-    1.1.1.7 Ensure udf kernel module is not available
-    """
-    module_name = "udf"
-    
-    if _is_module_loaded(module_name):
-        print(f"{COLORS['RED']}[-] FAIL: {module_name} module is loaded{COLORS['RESET']}")
-        print(f"    Remediation: Run 'rmmod {module_name}' to unload the module")
-        return False, f"1.1.1.7 Ensure {module_name} kernel module is not available", False
-    
-    if not _is_module_available(module_name) or _is_module_disabled(module_name):
-        print(f"{COLORS['GREEN']}[+] PASS: {module_name} module is not available or is disabled{COLORS['RESET']}")
-        return True, f"1.1.1.7 Ensure {module_name} kernel module is not available", True
+    1.1.1.x Ensure a filesystem kernel module is not available
     
-    print(f"{COLORS['RED']}[-] FAIL: {module_name} module is available to be loaded{COLORS['RESET']}")
-    print(f"    Remediation: Run 'sudo modprobe -r {module_name}' and create a disable-{module_name}.conf file")
-    return False, f"1.1.1.7 Ensure {module_name} kernel module is not available", False
-
-
-def remediate_udf():
-    """
-    Remediate 1.1.1.7 Ensure udf kernel module is not available
+    Runs one KERNEL_MODULE_CHECKS entry. Every module in module_names is
+    audited, even after one fails, so each gets its own status line.
     """
-    module_name = "udf"
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.7 Ensure {module_name} kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print(f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}")
-    print(f"    2. Create a configuration file to disable the module:")
-    print(f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf")
-    print(f"    3. Update the initramfs: sudo update-initramfs -u")
-    
-    return True
+    passed = all([_audit_kernel_module(module_name) for module_name in module_names])
+    return passed, f"{benchmark_id} Ensure {name} kernel module is not available", passed
 
 
-def check_fat():
+def remediate_kernel_module(benchmark_id, name, module_names):
     """
-    1.1.1.8 Ensure FAT kernel module is not available
+    Print the manual remediation steps for one KERNEL_MODULE_CHECKS entry
     """
-    # Check for both fat and vfat modules
-    fat_result = True
-    vfat_result = True
-    
-    # Check fat module
-    if _is_module_loaded("fat"):
-        print(f"{COLORS['RED']}[-] FAIL: fat module is loaded{COLORS['RESET']}")
-        print("    Remediation: Run 'rmmod fat' to unload the module")
-        fat_result = False
-    elif not _is_module_available("fat") or _is_module_disabled("fat"):
-        print(f"{COLORS['GREEN']}[+] PASS: fat module is not available or is disabled{COLORS['RESET']}")
-    else:
-        print(f"{COLORS['RED']}[-] FAIL: fat module is available to be loaded{COLORS['RESET']}")
-        print("    Remediation: Run 'sudo modprobe -r fat' and create a disable-fat.conf file")
-        fat_result = False
-    
-    # Check vfat module
-    if _is_module_loaded("vfat"):
-        print(f"{COLORS['RED']}[-] FAIL: vfat module is loaded{COLORS['RESET']}")
-        print("    Remediation: Run 'rmmod vfat' to unload the module")
-        vfat_result = False
-    elif not _is_module_available("vfat") or _is_module_disabled("vfat"):
-        print(f"{COLORS['GREEN']}[+] PASS: vfat module is not available or is disabled{COLORS['RESET']}")
+    lines = [
+        f"{COLORS['BLUE']}Remediating: {benchmark_id} Ensure {name} kernel module is not available{COLORS['RESET']}",
+        f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}",
+    ]
+    if len(module_names) == 1:
+        module_name = module_names[0]
+        lines += [
+            f"    1. Unload the module if it's loaded: sudo modprobe -r {module_name}",
+            "    2. Create a configuration file to disable the module:",
+            f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf",
+            "    3. Update the initramfs: sudo update-initramfs -u",
+        ]
     else:
-        print(f"{COLORS['RED']}[-] FAIL: vfat module is available to be loaded{COLORS['RESET']}")
-        print("    Remediation: Run 'sudo modprobe -r vfat' and create a disable-vfat.conf file")
-        vfat_result = False
-    
-    overall_result = fat_result and vfat_result
-    return overall_result, "1.1.1.8 Ensure FAT kernel module is not available", overall_result
-
-
-def remediate_fat():
-    """
-    Remediate 1.1.1.8 Ensure FAT kernel module is not available
-    """
-    print(f"{COLORS['BLUE']}Remediating: 1.1.1.8 Ensure FAT kernel module is not available{COLORS['RESET']}")
-    
-    print(f"{COLORS['YELLOW']}Manual remediation steps:{COLORS['RESET']}")
-    print("    1. Unload the vfat module first (as it depends on fat): sudo modprobe -r vfat")
-    print("    2. Create a configuration file to disable the vfat module:")
-    print("       sudo echo 'install vfat /bin/true' > /etc/modprobe.d/disable-vfat.conf")
-    print("    3. Unload the fat module: sudo modprobe -r fat")
-    print("    4. Create a configuration file to disable the fat module:")
-    print("       sudo echo 'install fat /bin/true' > /etc/modprobe.d/disable-fat.conf")
-    print("    5. Update the initramfs: sudo update-initramfs -u")
-    
+        # Each module depends on the one listed before it, so unload them in
+        # reverse; modprobe -r removes them in the order given, in one call
+        unload_order = module_names[::-1]
+        lines.append(f"    1. Unload the modules, dependents first: sudo modprobe -r {' '.join(unload_order)}")
+        for step, module_name in enumerate(unload_order, start=2):
+            lines += [
+                f"    {step}. Create a configuration file to disable the {module_name} module:",
+                f"       sudo echo 'install {module_name} /bin/true' > /etc/modprobe.d/disable-{module_name}.conf",
+            ]
+        lines.append(f"    {len(unload_order) + 2}. Update the initramfs: sudo update-initramfs -u")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     return True
 
 
@@ -394,31 +238,27 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
     print(f"{COLORS['BLUE']}Running Filesystem Kernel Module Audits...{COLORS['RESET']}")
     
-    results = [
-        check_cramfs(),
-        check_freevxfs(),
-        check_jffs2(),
-        check_hfs(),
-        check_hfsplus(),
-        check_squashfs(),
-        check_udf(),
-        check_fat()
-    ]
+    # The checks are independent, so run them concurrently
+    results = run_checks([
+        functools.partial(check_kernel_module, *check) for check in KERNEL_MODULE_CHECKS
+    ])
     
-    # Count passes and fails
+    # Count passes and fails once; the return value reuses the count
     passes = sum(1 for result in results if result[0])
     fails = len(results) - passes
     
-    print("\n" + "-" * 60)
-    print(f"{COLORS['BLUE']}Filesystem Kernel Module Audit Summary:{COLORS['RESET']}")
-    print(f"{COLORS['GREEN']}PASS: {passes}{COLORS['RESET']}")
-    print(f"{COLORS['RED']}FAIL: {fails}{COLORS['RESET']}")
-    print("-" * 60)
+    sys.stdout.write(
+        "\n" + "-" * 60 + "\n"
+        f"{COLORS['BLUE']}Filesystem Kernel Module Audit Summary:{COLORS['RESET']}\n"
+        f"{COLORS['GREEN']}PASS: {passes}{COLORS['RESET']}\n"
+        f"{COLORS['RED']}FAIL: {fails}{COLORS['RESET']}\n"
+        + "-" * 60 + "\n"
+    )
     
     if return_results:
         # Return a list of tuples (benchmark_id, description, result)
@@ -426,7 +266,7 @@ def run_all_audits(return_results=False):
         # We need to extract the benchmark_id_description and status
         return [(result[1], result[2]) for result in results]
     
-    return all(result[0] for result in results)
+    return fails == 0
 
 
 def run_all_remediations():
@@ -435,22 +275,12 @@ def run_all_remediations():
     """
     print(f"{COLORS['BLUE']}Running Filesystem Kernel Module Remediations...{COLORS['RESET']}")
     
-    remediation_functions = [
-        ("cramfs", remediate_cramfs),
-        ("freevxfs", remediate_freevxfs),
-        ("jffs2", remediate_jffs2),
-        ("hfs", remediate_hfs),
-        ("hfsplus", remediate_hfsplus),
-        ("squashfs", remediate_squashfs),
-        ("udf", remediate_udf),
-        ("FAT", remediate_fat)
-    ]
-    
-    for module_name, remediate_func in remediation_functions:
-        print(f"\n{COLORS['BLUE']}Remediating {module_name}...{COLORS['RESET']}")
-        remediate_func()
+    for benchmark_id, name, module_names in KERNEL_MODULE_CHECKS:
+        print(f"\n{COLORS['BLUE']}Remediating {name}...{COLORS['RESET']}")
+        remediate_kernel_module(benchmark_id, name, module_names)
     
     # Verify remediations by running audits again
+    clear_caches()
     print("\n" + "=" * 60)
     print(f"{COLORS['BLUE']}Verifying remediations...{COLORS['RESET']}")
     all_pass = run_all_audits()
@@ -463,27 +293,25 @@ def run_all_remediations():
     return all_pass
 
 
+# Actions available when this file is run directly
+_ACTIONS = {
+    "audit": run_all_audits,
+    "remediate": run_all_remediations,
+}
+
+
 def main():
     """
     Main function to parse arguments and run appropriate functions
     """
-    if len(sys.argv) < 2:
-        print("Error: Missing required argument.")
-        print("Usage: python3 fs_kernel_modules.py [audit|remediate]")
-        sys.exit(1)
+    import argparse
     
-    mode = sys.argv[1].lower()
+    parser = argparse.ArgumentParser(description="CIS 1.1.1 filesystem kernel module audit and remediation")
+    parser.add_argument("action", choices=_ACTIONS, type=str.lower, help="Action to perform")
+    args = parser.parse_args()
     
-    if mode == "audit":
-        success = run_all_audits()
-        sys.exit(0 if success else 1)
-    elif mode == "remediate":
-        success = run_all_remediations()
-        sys.exit(0 if success else 1)
-    else:
-        print(f"Error: Invalid mode '{mode}'.")
-        print("Usage: python3 fs_kernel_modules.py [audit|remediate]")
-        sys.exit(1)
+    success = _ACTIONS[args.action]()
+    sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
@@ -12,36 +12,38 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
 import sys
 
+from modules._common import COLORS
 
-def _run_command(command):
+
+# APT's main sources file, its drop-in directory, and the trusted keyring directory
+SOURCES_LIST_PATH = "/etc/apt/sources.list"
+SOURCES_LIST_DIR = "/etc/apt/sources.list.d"
+TRUSTED_GPG_DIR = "/etc/apt/trusted.gpg.d"
+
+
+def _list_dir(path):
     """
-    Run a shell command and return its output
+    Return the sorted names of the non-hidden entries in a directory, or an
+    empty list if it cannot be read
     """
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+        return sorted(name for name in os.listdir(path) if not name.startswith("."))
+    except OSError:
+        return []
+
+
+def _read_lines(path):
+    """
+    Return the lines of a file, or an empty list if it cannot be read
+    """
+    try:
+        with open(path) as f:
+            return f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
 
 
 def check_gpg_keys():
@@ -51,14 +53,14 @@ def check_gpg_keys():
     benchmark_id = "1.2.1.1"
     description = "Ensure GPG keys are configured (Manual)"
     
-    # Check if apt-key is deprecated and if apt-key list shows any keys
-    stdout, _, _ = _run_command("apt-key list")
-    
     # Check if there are keys in /etc/apt/trusted.gpg.d/
-    trusted_gpg_files, _, _ = _run_command("ls -l /etc/apt/trusted.gpg.d/ | grep -E '\\.(gpg|asc)$'")
+    trusted_gpg_files = [name for name in _list_dir(TRUSTED_GPG_DIR) if name.endswith((".gpg", ".asc"))]
     
     # Check if there are keys defined in sources.list files
-    sources_with_keys, _, _ = _run_command("grep -r 'signed-by=' /etc/apt/sources.list /etc/apt/sources.list.d/")
+    source_paths = [SOURCES_LIST_PATH]
+    for root, _, names in os.walk(SOURCES_LIST_DIR):
+        source_paths.extend(os.path.join(root, name) for name in sorted(names))
+    sources_with_keys = any("signed-by=" in line for path in source_paths for line in _read_lines(path))
     
     if trusted_gpg_files or sources_with_keys:
         print(f"{COLORS['GREEN']}[+] PASS: GPG keys are properly configured{COLORS['RESET']}")
@@ -79,10 +81,12 @@ def check_package_manager_repositories():
     description = "Ensure package manager repositories are configured (Manual)"
     
     # Check if sources.list and sources.list.d have entries
-    sources_list, _, _ = _run_command("grep -v '^#' /etc/apt/sources.list | grep -E '^deb '")
-    sources_list_d, _, _ = _run_command("grep -v '^#' /etc/apt/sources.list.d/*.list 2>/dev/null | grep -E '^deb '")
+    source_paths = [SOURCES_LIST_PATH]
+    source_paths.extend(os.path.join(SOURCES_LIST_DIR, name) for name in _list_dir(SOURCES_LIST_DIR)
+                        if name.endswith(".list"))
+    has_sources = any(line.startswith("deb ") for path in source_paths for line in _read_lines(path))
     
-    if sources_list or sources_list_d:
+    if has_sources:
         print(f"{COLORS['GREEN']}[+] PASS: Package manager repositories are configured{COLORS['RESET']}")
         print(f"    Found active repository entries in sources.list or sources.list.d")
         return True, f"{benchmark_id} {description}", True
@@ -135,21 +139,18 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
-    results = []
-    
-    # Run all check functions
-    gpg_result = check_gpg_keys()
-    results.append(gpg_result)
-    
-    repo_result = check_package_manager_repositories()
-    results.append(repo_result)
+    # The checks only read the APT configuration, so run them one after another
+    results = [
+        check_gpg_keys(),
+        check_package_manager_repositories()
+    ]
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)
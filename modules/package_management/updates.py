@@ -12,36 +12,7 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
-import os
-import sys
-
-
-def _run_command(command):
-    """
-    Run a shell command and return its output
-    """
-    try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+from modules._common import COLORS, run_command as _run_command
 
 
 def check_updates_installed():
@@ -52,16 +23,17 @@ def check_updates_installed():
     description = "Ensure updates, patches, and additional security software are installed (Manual)"
     
     # Check if there are any pending updates
-    stdout, _, _ = _run_command("apt list --upgradable 2>/dev/null | grep -v 'Listing...'")
+    stdout, _, _ = _run_command(["apt", "list", "--upgradable"], timeout=60)
+    upgradable = [line for line in stdout.splitlines() if not line.startswith("Listing...")]
     
-    if not stdout:
+    if not upgradable:
         print(f"{COLORS['GREEN']}[+] PASS: All available updates are installed{COLORS['RESET']}")
         print(f"    No pending updates found in the system")
         return True, f"{benchmark_id} {description}", True
     
     print(f"{COLORS['RED']}[-] FAIL: There are pending updates that need to be installed{COLORS['RESET']}")
     print(f"    Remediation: Run 'sudo apt update && sudo apt upgrade' to install updates")
-    print(f"    Number of pending updates: {len(stdout.splitlines())}")
+    print(f"    Number of pending updates: {len(upgradable)}")
     return False, f"{benchmark_id} {description}", False
 
 
@@ -91,7 +63,7 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
     results = []
@@ -102,7 +74,7 @@ def run_all_audits(return_results=False):
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)
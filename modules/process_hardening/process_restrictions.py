@@ -12,36 +12,56 @@ Each audit function:
 - Prints meaningful status messages
 """
 
-# ANSI color codes
-COLORS = {
-    'GREEN': '\033[92m',  # Green for PASS
-    'RED': '\033[91m',    # Red for FAIL
-    'YELLOW': '\033[93m', # Yellow for warnings
-    'BLUE': '\033[94m',   # Blue for section headers
-    'RESET': '\033[0m'    # Reset to default color
-}
-
-import subprocess
 import os
 import sys
 
+from modules._common import COLORS, run_command as _run_command, installed_packages, run_checks
 
-def _run_command(command):
+
+def _systemctl_state(unit):
+    """
+    Get a systemd unit's active and unit file state from a single systemctl call
+    
+    Returns:
+        tuple: (active_state, unit_file_state), empty strings when unknown
+    """
+    stdout, _, _ = _run_command(["systemctl", "show", "-p", "ActiveState", "-p", "UnitFileState", unit])
+    properties = dict(line.split("=", 1) for line in stdout.splitlines() if "=" in line)
+    return properties.get("ActiveState", ""), properties.get("UnitFileState", "")
+
+
+def _sysctl_value(sysctl_output):
+    """
+    Extract the value from "key = value" sysctl output, or "" if there is none
+    """
+    return sysctl_output.partition("=")[2].strip()
+
+
+# pam_limits reads limits.conf and then every file in limits.d
+LIMITS_CONF_PATH = "/etc/security/limits.conf"
+LIMITS_DIR = "/etc/security/limits.d"
+
+
+def _limits_lines():
     """
-    Run a shell command and return its output
+    Return the lines of limits.conf and the files in limits.d, skipping any
+    that cannot be read
     """
+    paths = [LIMITS_CONF_PATH]
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout.strip(), result.stderr.strip(), result.returncode
-    except Exception as e:
-        return "", str(e), 1
+        paths.extend(os.path.join(LIMITS_DIR, name) for name in sorted(os.listdir(LIMITS_DIR))
+                     if not name.startswith("."))
+    except OSError:
+        pass
+    
+    lines = []
+    for path in paths:
+        try:
+            with open(path) as limits_file:
+                lines.extend(limits_file.read().splitlines())
+        except OSError:
+            continue
+    return lines
 
 
 def check_address_space_layout_randomization():
@@ -52,9 +72,9 @@ def check_address_space_layout_randomization():
     description = "Ensure address space layout randomization (ASLR) is enabled (Automated)"
     
     # Check if ASLR is enabled
-    stdout, _, _ = _run_command("sysctl kernel.randomize_va_space")
+    stdout, _, _ = _run_command(["sysctl", "kernel.randomize_va_space"])
     
-    if "kernel.randomize_va_space = 2" in stdout:
+    if _sysctl_value(stdout) == "2":
         print(f"{COLORS['GREEN']}[+] PASS: Address space layout randomization (ASLR) is enabled{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
@@ -72,9 +92,9 @@ def check_ptrace_scope():
     description = "Ensure ptrace scope is restricted (Automated)"
     
     # Check if ptrace scope is restricted
-    stdout, _, _ = _run_command("sysctl kernel.yama.ptrace_scope")
+    stdout, _, _ = _run_command(["sysctl", "kernel.yama.ptrace_scope"])
     
-    if "kernel.yama.ptrace_scope = 1" in stdout or "kernel.yama.ptrace_scope = 2" in stdout or "kernel.yama.ptrace_scope = 3" in stdout:
+    if _sysctl_value(stdout) in ("1", "2", "3"):
         print(f"{COLORS['GREEN']}[+] PASS: ptrace scope is restricted{COLORS['RESET']}")
         print(f"    Current setting: {stdout}")
         return True, f"{benchmark_id} {description}", True
@@ -93,21 +113,18 @@ def check_core_dumps_restricted():
     description = "Ensure core dumps are restricted (Automated)"
     
     # Check if core dumps are restricted in sysctl
-    sysctl_stdout, _, _ = _run_command("sysctl fs.suid_dumpable")
+    sysctl_stdout, _, _ = _run_command(["sysctl", "fs.suid_dumpable"])
     
     # Check if core dumps are restricted in limits.conf
-    limits_stdout, _, _ = _run_command("grep -E \"hard core\" /etc/security/limits.conf /etc/security/limits.d/*")
+    limits_ok = any("hard core 0" in line for line in _limits_lines())
     
-    # Check if systemd-coredump is configured properly
-    systemd_stdout, _, _ = _run_command("systemctl is-enabled coredump.service 2>/dev/null || echo 'not installed'")
-    
-    if "fs.suid_dumpable = 0" in sysctl_stdout and "hard core 0" in limits_stdout:
+    if _sysctl_value(sysctl_stdout) == "0" and limits_ok:
         print(f"{COLORS['GREEN']}[+] PASS: Core dumps are restricted{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
     print(f"{COLORS['RED']}[-] FAIL: Core dumps are not properly restricted{COLORS['RESET']}")
     print(f"    sysctl setting: {sysctl_stdout}")
-    print(f"    limits.conf setting: {'Properly configured' if 'hard core 0' in limits_stdout else 'Not properly configured'}")
+    print(f"    limits.conf setting: {'Properly configured' if limits_ok else 'Not properly configured'}")
     print(f"    Remediation: Set fs.suid_dumpable to 0 and add 'hard core 0' to limits.conf")
     return False, f"{benchmark_id} {description}", False
 
@@ -120,9 +137,7 @@ def check_prelink_not_installed():
     description = "Ensure prelink is not installed (Automated)"
     
     # Check if prelink is installed
-    stdout, _, _ = _run_command("dpkg -s prelink 2>/dev/null | grep -E '^Status: install'")
-    
-    if not stdout:
+    if "prelink" not in installed_packages():
         print(f"{COLORS['GREEN']}[+] PASS: prelink is not installed{COLORS['RESET']}")
         return True, f"{benchmark_id} {description}", True
     
@@ -138,8 +153,9 @@ def check_automatic_error_reporting():
     benchmark_id = "1.5.5"
     description = "Ensure Automatic Error Reporting is not enabled (Automated)"
     
-    # Check if apport service is enabled
-    stdout, _, _ = _run_command("systemctl is-enabled apport.service 2>/dev/null || echo 'not installed'")
+    # Check if apport service is enabled; units that do not exist have no unit file state
+    _, unit_file_state = _systemctl_state("apport.service")
+    stdout = unit_file_state or "not installed"
     
     if stdout == "disabled" or stdout == "not installed":
         print(f"{COLORS['GREEN']}[+] PASS: Automatic Error Reporting is not enabled{COLORS['RESET']}")
@@ -248,30 +264,21 @@ def run_all_audits(return_results=False):
         return_results: If True, return a list of results instead of just True/False
     
     Returns:
-        If return_results is True, returns a list of tuples (benchmark_id, description, result)
+        If return_results is True, returns a list of tuples (benchmark_id_description, result)
         Otherwise, returns True if all checks pass, False otherwise
     """
-    results = []
-    
-    # Run all check functions
-    aslr_result = check_address_space_layout_randomization()
-    results.append(aslr_result)
-    
-    ptrace_result = check_ptrace_scope()
-    results.append(ptrace_result)
-    
-    core_dumps_result = check_core_dumps_restricted()
-    results.append(core_dumps_result)
-    
-    prelink_result = check_prelink_not_installed()
-    results.append(prelink_result)
-    
-    error_reporting_result = check_automatic_error_reporting()
-    results.append(error_reporting_result)
+    # The checks are independent, so run them concurrently
+    results = run_checks([
+        check_address_space_layout_randomization,
+        check_ptrace_scope,
+        check_core_dumps_restricted,
+        check_prelink_not_installed,
+        check_automatic_error_reporting
+    ])
     
     # If we need to return detailed results
     if return_results:
-        return results
+        return [(result[1], result[2]) for result in results]
     
     # Otherwise, return True only if all checks passed
     return all(result[2] for result in results)